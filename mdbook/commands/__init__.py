@@ -0,0 +1,6 @@
+"""CLI subcommands that are imported only when invoked.
+
+The mdbook command group registers these by "module:attribute" name, so
+their modules are not loaded for other commands. Nothing is re-exported
+here to keep it that way.
+"""
@@ -0,0 +1,76 @@
+"""The build command: render a book to HTML."""
+
+import os
+import sys
+from pathlib import Path
+
+import click
+
+from ..cli import get_book_info, get_container, resolve_book_path
+
+
+@click.command("build")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(),
+    help="Output directory for HTML files (default: book/html).",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Parallel render processes (default: 0 = CPU count).",
+)
+@click.pass_context
+def build(
+    ctx: click.Context, book: str | None, output: str | None, jobs: int
+) -> None:
+    """Build book to HTML with all features.
+
+    BOOK is the root directory of the book (default: current directory or global --book).
+
+    Renders all chapters to HTML with:
+    - Syntax highlighting
+    - Tables and footnotes
+    - Task lists
+    - Mermaid diagrams (client-side rendering)
+    - Navigation between chapters
+    """
+    from ..services import RenderService
+
+    container = get_container(ctx)
+
+    book_path = resolve_book_path(ctx, book)
+
+    try:
+        book_info = get_book_info(ctx, book_path)
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    # Determine output directory
+    if output:
+        output_dir = Path(output).absolute()
+    else:
+        output_dir = book_path / "html"
+
+    # Get render service
+    render_service = container.resolve(RenderService)
+
+    click.echo(f"Building book: {book_info.metadata.title}")
+    click.echo(f"Output directory: {output_dir}")
+
+    try:
+        generated = render_service.render_book(
+            book_info, output_dir, jobs=jobs or os.cpu_count() or 1
+        )
+        click.echo(f"\nGenerated {len(generated)} HTML files:")
+        if generated:
+            click.echo("\n".join(f"  {path.name}" for path in generated))
+        click.echo(f"\nOpen {output_dir / 'index.html'} to view the book.")
+    except PermissionError as e:
+        click.echo(f"Error: Permission denied - {e}", err=True)
+        sys.exit(1)
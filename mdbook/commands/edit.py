@@ -0,0 +1,434 @@
+"""The edit, append and insert commands: modify chapter content."""
+
+import mmap
+import os
+import stat
+import sys
+
+import click
+
+from ..cli import get_book_info, get_container, resolve_book_path
+
+# Stdin redirected from a regular file at least this large is decoded
+# from a memory map instead of being read through the text buffer
+_STDIN_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_stdin() -> str:
+    """Read all of stdin as text.
+
+    When stdin is a regular file (``mdbook append book 1 < big.md``) that
+    is large and unread, it is decoded straight from a memory map, which
+    avoids the chunked reads and intermediate buffers of sys.stdin.read().
+
+    Returns:
+        The content of stdin, with newlines normalized as in text mode.
+    """
+    try:
+        fd = sys.stdin.fileno()
+        st = os.fstat(fd)
+        use_mmap = (
+            stat.S_ISREG(st.st_mode)
+            and st.st_size >= _STDIN_MMAP_THRESHOLD
+            and os.lseek(fd, 0, os.SEEK_CUR) == 0
+        )
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a file descriptor (e.g. replaced in tests)
+        use_mmap = False
+
+    if not use_mmap:
+        return sys.stdin.read()
+
+    encoding = sys.stdin.encoding or "utf-8"
+    errors = sys.stdin.errors or "strict"
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        content = str(mm, encoding, errors)
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+@click.command("edit")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.argument("chapter", type=int)
+@click.option(
+    "--section",
+    "-s",
+    type=str,
+    help="Section to edit (heading text or 0-based index).",
+)
+@click.option(
+    "--content",
+    "-c",
+    type=str,
+    help="New content (if not provided, reads from stdin).",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show diff without making changes.",
+)
+@click.option(
+    "--no-backup",
+    is_flag=True,
+    help="Skip creating a backup file.",
+)
+@click.option(
+    "--interactive",
+    "-i",
+    is_flag=True,
+    help="Open chapter in $EDITOR for editing.",
+)
+@click.pass_context
+def edit(
+    ctx: click.Context,
+    book: str | None,
+    chapter: int,
+    section: str | None,
+    content: str | None,
+    dry_run: bool,
+    no_backup: bool,
+    interactive: bool,
+) -> None:
+    """Edit chapter or section content.
+
+    BOOK is the root directory of the book (default: current directory or global --book).
+    CHAPTER is the chapter number to edit.
+
+    Examples:
+        mdbook edit book/ 1 --section "Getting Started" --content "New text"
+        mdbook edit book/ 1 --content "Full chapter content"
+        mdbook edit book/ 1 --interactive
+        echo "New content" | mdbook edit book/ 1 --section "Intro"
+    """
+    import subprocess
+    import tempfile
+
+    book_path = resolve_book_path(ctx, book)
+
+    # Get container for writer service
+    container = get_container(ctx)
+
+    from ..services import IReaderService, IWriterService
+
+    writer_service = container.resolve(IWriterService)
+    reader_service = container.resolve(IReaderService)
+
+    try:
+        # Handle interactive mode
+        if interactive:
+            # Read current chapter content
+            book_info = get_book_info(ctx, book_path)
+            chapter_obj = book_info.get_chapter(chapter)
+            if chapter_obj is None:
+                click.echo(f"Error: Chapter {chapter} not found.", err=True)
+                sys.exit(1)
+
+            current_content = reader_service.get_chapter_body(chapter_obj)
+
+            # Write to temp file, removed again however the editor exits
+            fd, tmp_path = tempfile.mkstemp(suffix=".md")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                    tmp.write(current_content)
+                before = os.stat(tmp_path)
+
+                # Open in editor
+                editor = os.environ.get("EDITOR", "vim")
+                result = subprocess.run([editor, tmp_path])
+
+                if result.returncode != 0:
+                    click.echo("Editor exited with error. No changes made.", err=True)
+                    sys.exit(1)
+
+                # An untouched file means the edit was abandoned
+                after = os.stat(tmp_path)
+                if (after.st_mtime_ns, after.st_size) == (
+                    before.st_mtime_ns,
+                    before.st_size,
+                ):
+                    click.echo("No changes made.")
+                    return
+
+                # Read edited content
+                with open(tmp_path, encoding="utf-8") as f:
+                    content = f.read()
+            finally:
+                os.unlink(tmp_path)
+
+            # Update chapter
+            edit_result = writer_service.update_chapter_content(
+                book_path,
+                chapter,
+                content,
+                reader_service,
+                dry_run=dry_run,
+                create_backup=not no_backup,
+            )
+
+            if edit_result.success:
+                click.echo(edit_result.message)
+                if edit_result.backup_path:
+                    click.echo(f"  Backup: {edit_result.backup_path}")
+            else:
+                click.echo(f"Error: {edit_result.message}", err=True)
+                sys.exit(1)
+            return
+
+        # Get content from option or stdin
+        if content is None:
+            if not sys.stdin.isatty():
+                content = _read_stdin()
+            else:
+                click.echo(
+                    "Error: --content required or pipe content via stdin", err=True
+                )
+                sys.exit(1)
+
+        # Edit section or full chapter
+        if section is not None:
+            # Parse section identifier
+            try:
+                section_id: str | int = int(section)
+            except ValueError:
+                section_id = section
+
+            edit_result = writer_service.replace_section(
+                book_path,
+                chapter,
+                section_id,
+                content,
+                reader_service,
+                preserve_heading=True,
+                dry_run=dry_run,
+                create_backup=not no_backup,
+            )
+        else:
+            edit_result = writer_service.update_chapter_content(
+                book_path,
+                chapter,
+                content,
+                reader_service,
+                dry_run=dry_run,
+                create_backup=not no_backup,
+            )
+
+        if dry_run and edit_result.diff:
+            click.echo("Diff preview:")
+            click.echo(edit_result.diff)
+        elif edit_result.success:
+            click.echo(edit_result.message)
+            if edit_result.backup_path:
+                click.echo(f"  Backup: {edit_result.backup_path}")
+        else:
+            click.echo(f"Error: {edit_result.message}", err=True)
+            sys.exit(1)
+
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except KeyError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@click.command("append")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.argument("chapter", type=int)
+@click.option(
+    "--content",
+    "-c",
+    type=str,
+    help="Content to append (if not provided, reads from stdin).",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show diff without making changes.",
+)
+@click.option(
+    "--no-backup",
+    is_flag=True,
+    help="Skip creating a backup file.",
+)
+@click.pass_context
+def append(
+    ctx: click.Context,
+    book: str | None,
+    chapter: int,
+    content: str | None,
+    dry_run: bool,
+    no_backup: bool,
+) -> None:
+    """Append content to the end of a chapter.
+
+    BOOK is the root directory of the book (default: current directory or global --book).
+    CHAPTER is the chapter number to append to.
+
+    Examples:
+        mdbook append book/ 1 --content "Additional content here"
+        echo "New section content" | mdbook append book/ 1
+    """
+    # Get container for writer service
+    container = get_container(ctx)
+
+    from ..services import IReaderService, IWriterService
+
+    writer_service = container.resolve(IWriterService)
+    reader_service = container.resolve(IReaderService)
+    book_path = resolve_book_path(ctx, book)
+
+    try:
+        # Get content from option or stdin
+        if content is None:
+            if not sys.stdin.isatty():
+                content = _read_stdin()
+            else:
+                click.echo(
+                    "Error: --content required or pipe content via stdin", err=True
+                )
+                sys.exit(1)
+
+        edit_result = writer_service.append_to_chapter(
+            book_path,
+            chapter,
+            content,
+            reader_service,
+            dry_run=dry_run,
+            create_backup=not no_backup,
+        )
+
+        if dry_run and edit_result.diff:
+            click.echo("Diff preview:")
+            click.echo(edit_result.diff)
+        elif edit_result.success:
+            click.echo(edit_result.message)
+            if edit_result.backup_path:
+                click.echo(f"  Backup: {edit_result.backup_path}")
+        else:
+            click.echo(f"Error: {edit_result.message}", err=True)
+            sys.exit(1)
+
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except KeyError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@click.command("insert")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.argument("chapter", type=int)
+@click.option(
+    "--after",
+    type=str,
+    help="Section to insert after (heading text or index).",
+)
+@click.option(
+    "--before",
+    type=str,
+    help="Section to insert before (heading text or index).",
+)
+@click.option(
+    "--content",
+    "-c",
+    type=str,
+    help="Content to insert (if not provided, reads from stdin).",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show diff without making changes.",
+)
+@click.option(
+    "--no-backup",
+    is_flag=True,
+    help="Skip creating a backup file.",
+)
+@click.pass_context
+def insert(
+    ctx: click.Context,
+    book: str | None,
+    chapter: int,
+    after: str | None,
+    before: str | None,
+    content: str | None,
+    dry_run: bool,
+    no_backup: bool,
+) -> None:
+    """Insert content before or after a section.
+
+    BOOK is the root directory of the book (default: current directory or global --book).
+    CHAPTER is the chapter number.
+
+    Examples:
+        mdbook insert book/ 1 --after "Getting Started" --content "## New Section\\n\\nContent"
+        mdbook insert book/ 1 --before "Conclusion" --content "## Summary\\n\\nSummary here"
+    """
+    # Get container for writer service
+    container = get_container(ctx)
+
+    from ..services import IReaderService, IWriterService
+
+    writer_service = container.resolve(IWriterService)
+    reader_service = container.resolve(IReaderService)
+    book_path = resolve_book_path(ctx, book)
+
+    try:
+        # Validate options
+        if after is None and before is None:
+            click.echo("Error: --after or --before required", err=True)
+            sys.exit(1)
+        if after is not None and before is not None:
+            click.echo("Error: use only --after or --before, not both", err=True)
+            sys.exit(1)
+
+        # Get content from option or stdin
+        if content is None:
+            if not sys.stdin.isatty():
+                content = _read_stdin()
+            else:
+                click.echo(
+                    "Error: --content required or pipe content via stdin", err=True
+                )
+                sys.exit(1)
+
+        # Determine section and position
+        section_id_str = after if after is not None else before
+        position = "after" if after is not None else "before"
+
+        # Parse section identifier
+        try:
+            section_id: str | int = int(section_id_str)
+        except ValueError:
+            section_id = section_id_str
+
+        edit_result = writer_service.insert_at_section(
+            book_path,
+            chapter,
+            section_id,
+            content,
+            reader_service,
+            position=position,
+            dry_run=dry_run,
+            create_backup=not no_backup,
+        )
+
+        if dry_run and edit_result.diff:
+            click.echo("Diff preview:")
+            click.echo(edit_result.diff)
+        elif edit_result.success:
+            click.echo(edit_result.message)
+            if edit_result.backup_path:
+                click.echo(f"  Backup: {edit_result.backup_path}")
+        else:
+            click.echo(f"Error: {edit_result.message}", err=True)
+            sys.exit(1)
+
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except KeyError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
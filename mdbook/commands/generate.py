@@ -0,0 +1,100 @@
+"""The toc-gen and index-gen commands: generate TOC and index markdown."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from ..cli import get_book_info, get_container, resolve_book_path
+
+
+@click.command("toc-gen")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(),
+    help="Output file for TOC (default: stdout).",
+)
+@click.option(
+    "--full",
+    "-f",
+    is_flag=True,
+    help="Include intra-chapter headings in TOC.",
+)
+@click.pass_context
+def toc_gen(
+    ctx: click.Context, book: str | None, output: str | None, full: bool
+) -> None:
+    """Generate hierarchical table of contents.
+
+    BOOK is the root directory of the book (default: current directory or global --book).
+
+    Extracts all headings (##, ###, ####) from chapters and generates
+    a hierarchical markdown TOC.
+    """
+    from ..services import TocService
+
+    container = get_container(ctx)
+
+    book_path = resolve_book_path(ctx, book)
+
+    try:
+        book_info = get_book_info(ctx, book_path)
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    # Get TOC service
+    toc_service = container.resolve(TocService)
+
+    toc_md = toc_service.generate_toc_markdown(book_info, include_chapter_tocs=full)
+
+    if output:
+        output_path = Path(output).absolute()
+        output_path.write_text(toc_md)
+        click.echo(f"TOC written to {output_path}")
+    else:
+        click.echo(toc_md)
+
+
+@click.command("index-gen")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(),
+    help="Output file for index (default: stdout).",
+)
+@click.pass_context
+def index_gen(ctx: click.Context, book: str | None, output: str | None) -> None:
+    """Generate alphabetical index from markers.
+
+    BOOK is the root directory of the book (default: current directory or global --book).
+
+    Extracts terms marked with {{index: term}} and generates
+    an alphabetically sorted index with chapter/section references.
+    """
+    from ..services import IndexService
+
+    container = get_container(ctx)
+
+    book_path = resolve_book_path(ctx, book)
+
+    try:
+        book_info = get_book_info(ctx, book_path)
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    # Get index service
+    index_service = container.resolve(IndexService)
+
+    index_md = index_service.generate_index_markdown(book_info)
+
+    if output:
+        output_path = Path(output).absolute()
+        output_path.write_text(index_md)
+        click.echo(f"Index written to {output_path}")
+    else:
+        click.echo(index_md)
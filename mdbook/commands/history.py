@@ -0,0 +1,221 @@
+"""The history and diff commands: show git history for a book."""
+
+import sys
+from itertools import islice
+
+import click
+
+from ..cli import get_book_info, get_container, resolve_book_path
+
+
+@click.command("history")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.option(
+    "--chapter",
+    "-c",
+    type=int,
+    help="Chapter number to show history for (if omitted, shows recent changes for book).",
+)
+@click.option(
+    "--limit",
+    "-n",
+    type=int,
+    default=20,
+    help="Maximum number of commits to show (default: 20).",
+)
+@click.pass_context
+def history(
+    ctx: click.Context, book: str | None, chapter: int | None, limit: int
+) -> None:
+    """Show git commit history for a chapter or book.
+
+    BOOK is the root directory of the book (default: current directory or global --book).
+
+    Examples:
+        mdbook history book/           # Recent changes across book
+        mdbook history book/ -c 1      # History for chapter 1
+        mdbook history book/ -c 0      # History for intro chapter
+        mdbook history book/ -n 50     # Show up to 50 commits
+    """
+    from ..services import GitService
+
+    container = get_container(ctx)
+
+    git_service = container.resolve(GitService)
+    book_path = resolve_book_path(ctx, book)
+
+    # Check if this is a git repo
+    if not git_service.is_git_repo(book_path):
+        click.echo(f"Error: {book_path} is not in a git repository.", err=True)
+        sys.exit(1)
+
+    if chapter is not None:
+        # Show history for specific chapter
+        try:
+            book_info = get_book_info(ctx, book_path)
+            ch = book_info.get_chapter(chapter)
+            if ch is None:
+                click.echo(f"Error: Chapter {chapter} not found.", err=True)
+                sys.exit(1)
+
+            history_data = git_service.get_chapter_history(ch.file_path, limit)
+
+            # Format the whole listing and write it once
+            lines = [
+                f"\nHistory for Chapter {chapter}: {ch.title}",
+                f"File: {ch.file_path}",
+                "=" * 60,
+            ]
+
+            if not history_data.commits:
+                lines.append("No commits found for this chapter.")
+            else:
+                for commit in history_data.commits:
+                    lines.append(
+                        f"\n{commit.short_hash} - {commit.date:%Y-%m-%d %H:%M}"
+                    )
+                    lines.append(f"  Author: {commit.author} <{commit.author_email}>")
+                    lines.append(f"  {commit.subject}")
+            click.echo("\n".join(lines))
+
+        except FileNotFoundError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+    else:
+        # Show recent changes across book
+        try:
+            changes = git_service.get_recent_changes(book_path, limit)
+
+            lines = [f"\nRecent changes in {book_path}", "=" * 60]
+
+            if not changes:
+                lines.append("No recent changes found.")
+            else:
+                for change in changes:
+                    lines.append(
+                        f"\n{change.commit.short_hash} - "
+                        f"{change.commit.date:%Y-%m-%d %H:%M}"
+                    )
+                    lines.append(f"  [{change.change_type}] {change.file_path}")
+                    lines.append(f"  {change.commit.subject}")
+            click.echo("\n".join(lines))
+
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+
+
+@click.command("diff")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.argument("chapter", type=int)
+@click.option(
+    "--from",
+    "commit_from",
+    default="HEAD~1",
+    help="Starting commit (older version). Default: HEAD~1.",
+)
+@click.option(
+    "--to",
+    "commit_to",
+    default="HEAD",
+    help="Ending commit (newer version). Default: HEAD.",
+)
+@click.option(
+    "--raw",
+    is_flag=True,
+    help="Show raw diff output instead of formatted.",
+)
+@click.pass_context
+def diff_cmd(
+    ctx: click.Context,
+    book: str | None,
+    chapter: int,
+    commit_from: str,
+    commit_to: str,
+    raw: bool,
+) -> None:
+    """Show diff between versions of a chapter.
+
+    BOOK is the root directory of the book.
+    CHAPTER is the chapter number to diff.
+
+    Examples:
+        mdbook diff book/ 1                      # Diff chapter 1: HEAD~1 to HEAD
+        mdbook diff book/ 1 --from=HEAD~3        # Diff last 3 commits
+        mdbook diff book/ 1 --from=abc123 --to=def456  # Between specific commits
+        mdbook diff book/ 1 --raw                # Show raw git diff output
+    """
+    from ..services import GitService
+
+    container = get_container(ctx)
+
+    git_service = container.resolve(GitService)
+    book_path = resolve_book_path(ctx, book)
+
+    # Check if this is a git repo
+    if not git_service.is_git_repo(book_path):
+        click.echo(f"Error: {book_path} is not in a git repository.", err=True)
+        sys.exit(1)
+
+    try:
+        book_info = get_book_info(ctx, book_path)
+        ch = book_info.get_chapter(chapter)
+        if ch is None:
+            click.echo(f"Error: Chapter {chapter} not found.", err=True)
+            sys.exit(1)
+
+        if raw:
+            # Raw output needs no statistics up front, so stream it
+            # straight from git instead of collecting the whole diff
+            diff_lines = git_service.iter_chapter_diff(
+                ch.file_path, commit_from, commit_to
+            )
+        else:
+            diff_data = git_service.get_chapter_diff(
+                ch.file_path, commit_from, commit_to
+            )
+
+        click.echo(f"\nDiff for Chapter {chapter}: {ch.title}")
+        click.echo(f"From: {commit_from} -> To: {commit_to}")
+        click.echo("=" * 60)
+
+        if raw:
+            # Echo in batches of lines, since each echo flushes stdout
+            has_changes = False
+            for chunk in iter(lambda: "".join(islice(diff_lines, 512)), ""):
+                has_changes = True
+                click.echo(chunk, nl=False)
+            if not has_changes:
+                click.echo("No changes between these commits.")
+        elif not diff_data.has_changes:
+            click.echo("No changes between these commits.")
+        else:
+            # Style the whole diff and write it once; click.echo strips the
+            # colors again when stdout isn't a terminal
+            lines = [
+                f"  +{diff_data.additions} additions, -{diff_data.deletions} deletions",
+                "",
+            ]
+            for hunk in diff_data.hunks:
+                lines.append(
+                    f"@@ -{hunk.old_start},{hunk.old_count} "
+                    f"+{hunk.new_start},{hunk.new_count} @@"
+                )
+                for line in hunk.content.split("\n"):
+                    if line[:1] == "+":
+                        lines.append(click.style(line, fg="green"))
+                    elif line[:1] == "-":
+                        lines.append(click.style(line, fg="red"))
+                    else:
+                        lines.append(line)
+            click.echo("\n".join(lines))
+
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
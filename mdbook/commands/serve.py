@@ -0,0 +1,124 @@
+"""The serve command: preview a book over HTTP."""
+
+import http.server
+import sys
+
+import click
+
+from ..cli import resolve_book_path
+
+
+class _QuietHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """HTTP request handler that suppresses console output.
+
+    Speaks HTTP/1.1 so browsers keep the connection open and fetch a page's
+    stylesheets, scripts and images without a new TCP handshake each.
+    SimpleHTTPRequestHandler always sends Content-Length, which persistent
+    connections require.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        """Suppress log messages by default."""
+        pass
+
+
+class _BookHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server for book previews.
+
+    Serves each request on its own thread so a page's assets load in
+    parallel, and allows quick restarts on the same port.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def _bind_server(
+    ports: range, handler: type[http.server.BaseHTTPRequestHandler]
+) -> _BookHTTPServer | None:
+    """Create a server listening on the first port in a range that is free.
+
+    The server binds each port itself instead of probing it first, so no
+    other process can take the port between the check and the bind.
+
+    Args:
+        ports: The ports to try, in order.
+        handler: The request handler class for the server.
+
+    Returns:
+        A bound and listening server, or None if no port could be bound.
+    """
+    for port in ports:
+        try:
+            return _BookHTTPServer(("", port), handler)
+        except OSError:
+            continue
+    return None
+
+
+@click.command("serve")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.option(
+    "--port",
+    "-p",
+    type=int,
+    default=None,
+    help="Port to serve on (default: 3500, with fallback to 3501-3509 if busy).",
+)
+@click.pass_context
+def serve(ctx: click.Context, book: str | None, port: int | None) -> None:
+    """Serve the book locally via HTTP.
+
+    BOOK is the root directory of the book (default: current directory or global --book).
+
+    Starts a local HTTP server to preview the book. By default uses port 3500,
+    with automatic fallback to ports 3501-3509 if the port is in use.
+
+    Press Ctrl+C to stop the server.
+    """
+    book_path = resolve_book_path(ctx, book)
+
+    # Verify the book exists
+    if not book_path.exists():
+        click.echo(f"Error: Book directory not found: {book_path}", err=True)
+        sys.exit(1)
+
+    # Create a handler that serves from the book directory
+    class BookHTTPHandler(_QuietHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(book_path), **kwargs)
+
+    # Bind the port to use
+    if port is not None:
+        # User specified a port, use it directly
+        httpd = _bind_server(range(port, port + 1), BookHTTPHandler)
+        if httpd is None:
+            click.echo(f"Error: Port {port} is already in use.", err=True)
+            sys.exit(1)
+    else:
+        # Take the first available port in the default range
+        httpd = _bind_server(range(3500, 3510), BookHTTPHandler)
+        if httpd is None:
+            click.echo(
+                "Error: All ports in range 3500-3509 are in use. "
+                "Specify a different port with --port.",
+                err=True,
+            )
+            sys.exit(1)
+
+    # Start the server
+    actual_port = httpd.server_address[1]
+    click.echo(f"Serving book at http://localhost:{actual_port}")
+    click.echo(f"Book directory: {book_path}")
+    click.echo("Press Ctrl+C to stop the server.")
+
+    try:
+        with httpd:
+            httpd.serve_forever()
+    except KeyboardInterrupt:
+        click.echo("\nServer stopped.")
+    except OSError as e:
+        click.echo(f"Error starting server: {e}", err=True)
+        sys.exit(1)
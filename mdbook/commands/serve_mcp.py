@@ -0,0 +1,23 @@
+"""The serve-mcp command: run the MCP server over stdio."""
+
+import click
+
+
+@click.command("serve-mcp")
+def serve_mcp() -> None:
+    """Start MCP server for Claude Code.
+
+    Launches the Model Context Protocol server that exposes
+    book operations as tools for AI assistants.
+
+    The server communicates over stdio and provides tools for:
+    - book_info: Get book metadata and chapter list
+    - read_chapter: Read chapter content
+    - list_chapters: List all chapters
+    - create_book: Create a new book project
+    - add_chapter: Add a chapter to a book
+    - update_toc: Regenerate the table of contents
+    """
+    from ..mcp import run_server
+
+    run_server()
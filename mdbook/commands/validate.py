@@ -0,0 +1,63 @@
+"""The validate-images command: report missing image references."""
+
+import sys
+
+import click
+
+from ..cli import get_book_info, get_container, resolve_book_path
+
+
+@click.command("validate-images")
+@click.argument("book", type=click.Path(exists=True), default=None, required=False)
+@click.pass_context
+def validate_images(ctx: click.Context, book: str | None) -> None:
+    """Validate that all referenced images exist.
+
+    BOOK is the root directory of the book (default: current directory or global --book).
+
+    Checks all ![alt](path) image references and reports any missing files.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ..services import ContentService, IReaderService
+
+    container = get_container(ctx)
+
+    book_path = resolve_book_path(ctx, book)
+
+    try:
+        book_info = get_book_info(ctx, book_path)
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    # Get services
+    content_service = container.resolve(ContentService)
+    reader_service = container.resolve(IReaderService)
+
+    def check_chapter(chapter):
+        content = reader_service.get_chapter_content(chapter)
+        return content_service.validate_images(content, chapter.file_path)
+
+    # Chapters are independent and the checks are I/O bound, so read and
+    # stat them concurrently; map() keeps results in chapter order
+    workers = min(32, len(book_info.chapters) or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(check_chapter, book_info.chapters))
+
+    # Collect the report and write it in one go
+    lines: list[str] = []
+    missing_count = 0
+    for chapter, missing in zip(book_info.chapters, results):
+        if missing:
+            lines.append(f"\nChapter {chapter.number or 'Intro'}: {chapter.title}")
+            for img in missing:
+                lines.append(f"  Line {img.line_number}: {img.path}")
+                missing_count += 1
+
+    if missing_count == 0:
+        click.echo("All image references are valid.")
+    else:
+        lines.append(f"\nFound {missing_count} missing image(s).")
+        click.echo("\n".join(lines))
+        sys.exit(1)
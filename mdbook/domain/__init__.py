@@ -13,6 +13,8 @@ from .content import (
     IndexTerm,
     IndexEntry,
     BookIndex,
+)
+from .git import (
     CommitInfo,
     DiffHunk,
     FileDiff,
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import date
 from .chapter import Chapter
 
@@ -19,12 +19,34 @@ class Book:
     root_path: Path
     metadata: BookMetadata
     chapters: List[Chapter] = field(default_factory=list)
+    # Number index and the chapter list it was built from
+    _by_number: Dict[int, Tuple[int, Chapter]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed: Optional[List[Chapter]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_len: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def by_number(self) -> Dict[int, Tuple[int, Chapter]]:
+        # Maps chapter number to (position, chapter), keeping the first
+        # chapter for duplicated numbers. Rebuilt when the chapter list is
+        # replaced or grows/shrinks, e.g. after a chapter is added
+        chapters = self.chapters
+        if self._indexed is not chapters or self._indexed_len != len(chapters):
+            index: Dict[int, Tuple[int, Chapter]] = {}
+            for idx, ch in enumerate(chapters):
+                if ch.number is not None:
+                    index.setdefault(ch.number, (idx, ch))
+            self._by_number = index
+            self._indexed = chapters
+            self._indexed_len = len(chapters)
+        return self._by_number
 
     def get_chapter(self, number: int) -> Optional[Chapter]:
-        for ch in self.chapters:
-            if ch.number == number:
-                return ch
-        return None
+        entry = self.by_number.get(number)
+        return entry[1] if entry is not None else None
 
     def get_intro(self) -> Optional[Chapter]:
         for ch in self.chapters:
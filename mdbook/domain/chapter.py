@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional
 from datetime import date
 
 
@@ -20,10 +20,39 @@ class Chapter:
     metadata: ChapterMetadata
     is_intro: bool = False
 
+    @classmethod
+    def deferred(
+        cls,
+        file_path: Path,
+        number: int,
+        loader: Callable[[], ChapterMetadata],
+        is_intro: bool = False,
+    ) -> "Chapter":
+        # Metadata is loaded on first access; the number is known up front
+        # so lookups by number don't force a read of the chapter file
+        chapter = cls.__new__(cls)
+        chapter.file_path = file_path
+        chapter.is_intro = is_intro
+        chapter._number = number
+        chapter._loader = loader
+        return chapter
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for deferred chapters whose metadata isn't loaded yet
+        if name == "metadata" and "_loader" in self.__dict__:
+            self.metadata = self.__dict__["_loader"]()
+            del self.__dict__["_loader"]
+            return self.metadata
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
     @property
     def title(self) -> str:
         return self.metadata.title
 
     @property
     def number(self) -> Optional[int]:
+        if "metadata" not in self.__dict__ and "_number" in self.__dict__:
+            return self._number
         return self.metadata.number
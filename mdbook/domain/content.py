@@ -1,15 +1,45 @@
 """Domain models for content features.
 
 Provides dataclasses for TOC entries, index terms, image references,
-and git version control information.
+and mermaid diagram blocks.
 """
 
+import bisect
+import io
+import re
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from typing import Optional
 
+# Characters dropped from slugs, and runs collapsed into a single hyphen
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[\s_-]+")
 
-@dataclass
+# The same rules as a translate table for ASCII text: letters are
+# lowercased, digits kept, separators turned into "-" and anything else
+# deleted, all in one pass
+_SLUG_TABLE = {
+    code: (
+        chr(code).lower()
+        if chr(code).isalnum()
+        else "-"
+        if _SLUG_DASH.match(chr(code))
+        else None
+    )
+    for code in range(128)
+}
+
+# Indentation by nesting depth; TOC headings go at most four deep
+_INDENT = ("", "  ", "    ", "      ", "        ")
+
+# Sort key for index entries, as a C-level callable instead of a lambda
+_SORT_KEY = attrgetter("sort_key")
+
+
+@dataclass(slots=True)
 class TocEntry:
     """A single entry in a table of contents.
 
@@ -22,22 +52,35 @@ class TocEntry:
     anchor: str  # URL-friendly slug
     children: list["TocEntry"] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Interned so repeated anchors share one string and compare by identity
+        self.anchor = sys.intern(self.anchor)
+
     @property
     def indent(self) -> str:
         """Get indentation for rendering."""
-        return "  " * (self.level - 1)
+        return _indent(self.level - 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChapterToc:
     """TOC for a single chapter."""
 
     chapter_number: Optional[int]
     chapter_title: str
     entries: list[TocEntry] = field(default_factory=list)
+    # Number shown before the title and the title's anchor in the book
+    # TOC, both worked out once
+    prefix: str = field(init=False, repr=False, compare=False)
+    slug: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.chapter_title = sys.intern(self.chapter_title)
+        self.prefix = "Intro" if self.chapter_number == 0 else f"{self.chapter_number}"
+        self.slug = slugify(self.chapter_title)
 
 
-@dataclass
+@dataclass(slots=True)
 class BookToc:
     """Full book TOC with nested structure."""
 
@@ -46,20 +89,41 @@ class BookToc:
 
     def to_markdown(self) -> str:
         """Render the TOC as markdown."""
-        lines = [f"# {self.title}", ""]
+        titles, anchors, depths = self._flatten()
+        # Each line after the heading is written with its leading newline
+        buf = io.StringIO()
+        buf.write(f"# {self.title}\n")
+        for title, anchor, depth in zip(titles, anchors, depths):
+            buf.write(f"\n{_indent(depth)}- [{title}](#{anchor})")
+        return buf.getvalue()
+
+    def _flatten(self) -> tuple[list[str], list[str], list[int]]:
+        """Flatten the TOC into parallel title, anchor and depth lists.
+
+        Chapter lines have depth 0 and their headings follow at their
+        heading level, in the order they are rendered. The heading trees
+        are walked depth-first with an explicit stack.
+        """
+        titles: list[str] = []
+        anchors: list[str] = []
+        depths: list[int] = []
         for chapter in self.chapters:
-            prefix = (
-                "Intro" if chapter.chapter_number == 0 else f"{chapter.chapter_number}"
-            )
-            lines.append(
-                f"- [{prefix}. {chapter.chapter_title}](#{_slugify(chapter.chapter_title)})"
-            )
-            for entry in chapter.entries:
-                lines.extend(_render_toc_entry(entry, 1))
-        return "\n".join(lines)
-
-
-@dataclass
+            titles.append(f"{chapter.prefix}. {chapter.chapter_title}")
+            anchors.append(chapter.slug)
+            depths.append(0)
+
+            stack = list(reversed(chapter.entries))
+            while stack:
+                node = stack.pop()
+                titles.append(node.title)
+                anchors.append(node.anchor)
+                depths.append(node.level)
+                # Reversed so the first child is visited next
+                stack.extend(reversed(node.children))
+        return titles, anchors, depths
+
+
+@dataclass(slots=True)
 class ImageRef:
     """A reference to an image in chapter content."""
 
@@ -69,7 +133,7 @@ class ImageRef:
     exists: bool = True  # Validated during chapter read
 
 
-@dataclass
+@dataclass(slots=True)
 class MermaidBlock:
     """A mermaid diagram code block."""
 
@@ -78,7 +142,7 @@ class MermaidBlock:
     end_line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexTerm:
     """An indexable term with location information."""
 
@@ -88,142 +152,131 @@ class IndexTerm:
     section_heading: str = ""
     anchor: str = ""
 
+    def __post_init__(self) -> None:
+        # Every term in a chapter repeats its title and, per section, its
+        # anchor; interning collapses the copies into one string each
+        self.chapter_title = sys.intern(self.chapter_title)
+        self.anchor = sys.intern(self.anchor)
+
 
-@dataclass
+@dataclass(slots=True)
 class IndexEntry:
     """A single index entry with all locations."""
 
     term: str
-    locations: list[IndexTerm] = field(default_factory=list)
-
-    @property
-    def sort_key(self) -> str:
-        """Key for alphabetical sorting."""
-        return self.term.lower()
-
-
-@dataclass
+    # A list while the index is built; BookIndex.freeze() makes it a tuple
+    locations: list[IndexTerm] | tuple[IndexTerm, ...] = field(default_factory=list)
+    # Key for alphabetical sorting, lowercased once rather than per sort
+    sort_key: str = field(init=False, repr=False, compare=False)
+    # Markdown for the locations, built on first render; add_location()
+    # clears it, so add locations through it rather than the list
+    _rendered: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.sort_key = self.term.lower()
+
+    def add_location(self, location: IndexTerm) -> None:
+        """Add a location for this term."""
+        if isinstance(self.locations, tuple):
+            self.locations = list(self.locations)
+        self.locations.append(location)
+        self._rendered = None
+
+    def render_locations(self) -> str:
+        """Render the locations as a comma-separated list of links."""
+        if self._rendered is None:
+            self._rendered = ", ".join(map(_format_location, self.locations))
+        return self._rendered
+
+
+@dataclass(slots=True)
 class BookIndex:
-    """Complete book index."""
+    """Complete book index.
+
+    Entries are kept in sort_key order; use add() to insert more.
+    """
 
     entries: list[IndexEntry] = field(default_factory=list)
 
-    def to_markdown(self) -> str:
-        """Render the index as markdown."""
-        sorted_entries = sorted(self.entries, key=lambda e: e.sort_key)
-        lines = ["# Index", ""]
-        current_letter = ""
-
-        for entry in sorted_entries:
-            first_letter = entry.term[0].upper() if entry.term else ""
-            if first_letter != current_letter:
-                current_letter = first_letter
-                lines.append(f"\n## {current_letter}\n")
-
-            locations = ", ".join(
-                f"[{loc.chapter_title}](#{loc.anchor})"
-                if loc.anchor
-                else loc.chapter_title
+    def __post_init__(self) -> None:
+        # Linear when the entries arrive sorted, as IndexService's do
+        self.entries = sorted(self.entries, key=_SORT_KEY)
+
+    def add(self, entry: IndexEntry) -> None:
+        """Insert an entry at its sorted position."""
+        bisect.insort(self.entries, entry, key=_SORT_KEY)
+
+    def freeze(self) -> None:
+        """Compact the locations once all terms are collected.
+
+        Each entry's locations become a tuple, and equal locations (the
+        same term marked again in the same section) share one IndexTerm.
+        Entries can still be added to afterwards.
+        """
+        seen: dict[tuple, IndexTerm] = {}
+        for entry in self.entries:
+            entry.locations = tuple(
+                seen.setdefault(
+                    (
+                        loc.term,
+                        loc.chapter_number,
+                        loc.chapter_title,
+                        loc.section_heading,
+                        loc.anchor,
+                    ),
+                    loc,
+                )
                 for loc in entry.locations
             )
-            lines.append(f"- **{entry.term}**: {locations}")
-
-        return "\n".join(lines)
-
-
-@dataclass
-class CommitInfo:
-    """Information about a git commit.
-
-    Represents metadata from a single commit affecting a file.
-    """
-
-    hash: str  # Full SHA-1 hash
-    short_hash: str  # Abbreviated hash (7 chars)
-    author: str
-    author_email: str
-    date: datetime
-    message: str
-    subject: str  # First line of commit message
-
-
-@dataclass
-class DiffHunk:
-    """A single hunk from a diff.
-
-    Represents a contiguous block of changes.
-    """
-
-    old_start: int  # Starting line in old version
-    old_count: int  # Number of lines in old version
-    new_start: int  # Starting line in new version
-    new_count: int  # Number of lines in new version
-    content: str  # The actual diff content with +/- prefixes
-
-
-@dataclass
-class FileDiff:
-    """Diff information between two versions of a file.
-
-    Contains parsed diff output with statistics and hunks.
-    """
-
-    file_path: str
-    commit_from: str  # Commit hash or ref for old version
-    commit_to: str  # Commit hash or ref for new version
-    additions: int  # Lines added
-    deletions: int  # Lines removed
-    hunks: list[DiffHunk] = field(default_factory=list)
-    raw_diff: str = ""  # Full raw diff output
-
-    @property
-    def has_changes(self) -> bool:
-        """Check if there are any changes."""
-        return self.additions > 0 or self.deletions > 0
 
+    def to_markdown(self) -> str:
+        """Render the index as markdown."""
+        # Each line after the heading is written with its leading newline
+        buf = io.StringIO()
+        buf.write("# Index\n")
 
-@dataclass
-class ChapterHistory:
-    """Git history for a chapter file.
+        # Entries are sorted, so each initial letter is one contiguous run;
+        # entries with an empty term sort first and get no heading
+        for letter, group in groupby(self.entries, key=lambda e: e.term[:1].upper()):
+            if letter:
+                buf.write(f"\n\n## {letter}\n")
 
-    Contains list of commits that affected the chapter.
-    """
+            for entry in group:
+                buf.write(f"\n- **{entry.term}**: {entry.render_locations()}")
 
-    chapter_path: str
-    commits: list[CommitInfo] = field(default_factory=list)
+        return buf.getvalue()
 
-    @property
-    def commit_count(self) -> int:
-        """Number of commits in history."""
-        return len(self.commits)
 
+@lru_cache(maxsize=4096)
+def slugify(text: str) -> str:
+    """Convert text to URL-friendly slug.
 
-@dataclass
-class RecentChange:
-    """A recent change in the book repository.
-
-    Combines commit info with the affected file path.
+    This is the one slug implementation; the TOC, index, writer and
+    render services all use it so their anchors agree. The tables and
+    patterns it uses are built once at import, and results are cached
+    since the same titles are slugified on every render.
     """
+    if text.isascii():
+        # Splitting on "-" drops the empty pieces, which both collapses
+        # hyphen runs and strips them from the ends
+        return "-".join(filter(None, text.translate(_SLUG_TABLE).split("-")))
 
-    file_path: str
-    commit: CommitInfo
-    change_type: str = "modified"  # added, modified, deleted
+    text = text.lower().strip()
+    text = _SLUG_STRIP.sub("", text)
+    text = _SLUG_DASH.sub("-", text)
+    return text.strip("-")
 
 
-def _slugify(text: str) -> str:
-    """Convert text to URL-friendly slug."""
-    import re
+def _indent(depth: int) -> str:
+    """Get the indentation for a nesting depth, from _INDENT when it fits."""
+    if 0 <= depth < len(_INDENT):
+        return _INDENT[depth]
+    return "  " * depth
 
-    text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "-", text)
-    return text.strip("-")
 
+def _format_location(loc: IndexTerm) -> str:
+    """Render one index location, linked when it has an anchor."""
+    return f"[{loc.chapter_title}](#{loc.anchor})" if loc.anchor else loc.chapter_title
 
-def _render_toc_entry(entry: TocEntry, base_indent: int) -> list[str]:
-    """Render a TOC entry and its children."""
-    indent = "  " * (base_indent + entry.level - 1)
-    lines = [f"{indent}- [{entry.title}](#{entry.anchor})"]
-    for child in entry.children:
-        lines.extend(_render_toc_entry(child, base_indent))
-    return lines
@@ -1,4 +1,12 @@
 # mdbook infrastructure layer
+from .book_cache import load_book_info
 from .container import ServiceContainer, configure_services
+from .json_codec import json_dumps, json_loads
 
-__all__ = ["ServiceContainer", "configure_services"]
+__all__ = [
+    "ServiceContainer",
+    "configure_services",
+    "json_dumps",
+    "json_loads",
+    "load_book_info",
+]
@@ -0,0 +1,392 @@
+"""Persistent on-disk cache for parsed book information.
+
+Stores the result of IBookService.get_book_info under the book's
+.mdbook-cache directory so repeated CLI invocations don't re-parse the
+structure files and every chapter's frontmatter. The cache is keyed by a
+fingerprint of stat results (mtime and size) for the structure files, the
+directories they live in, and every chapter file, and is discarded as soon
+as any of them changes.
+"""
+
+import json
+import os
+import re
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from ..domain import Book, BookMetadata, Chapter, ChapterMetadata
+from ..services import IBookService
+
+CACHE_DIR_NAME = ".mdbook-cache"
+CACHE_FILE_NAME = "book_info.json"
+
+# Environment variable that disables the cache when set to a non-empty value
+NO_CACHE_ENV = "MDBOOK_NO_CACHE"
+
+# Bump when the stored layout changes so old caches are ignored
+CACHE_VERSION = 2
+
+# Files and directories, relative to the book root, that decide the
+# format and chapter list; missing ones are recorded too so that creating
+# one later invalidates the cache
+STRUCTURE_PATHS = (
+    ".",
+    "src",
+    "manuscript",
+    "content",
+    "SUMMARY.md",
+    "src/SUMMARY.md",
+    "Book.txt",
+    "manuscript/Book.txt",
+    "_bookdown.yml",
+    "book.toml",
+    "book.yaml",
+    "book.yml",
+)
+
+# Chapter links in SUMMARY.md, as StructureService matches them
+_SUMMARY_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+\.md)\)")
+
+# Book.txt lines that mark a section rather than name a file
+_LEANPUB_MARKERS = ("frontmatter:", "mainmatter:", "backmatter:")
+
+
+def cache_disabled() -> bool:
+    """Check whether the cache is disabled through the environment.
+
+    Returns:
+        True if MDBOOK_NO_CACHE is set to a non-empty value.
+    """
+    return bool(os.environ.get(NO_CACHE_ENV))
+
+
+def load_book_info(
+    book_service: IBookService, root: Path, use_cache: bool = True
+) -> Book:
+    """Get book information, reusing the on-disk cache when it is fresh.
+
+    Args:
+        book_service: Service used to load the book on a cache miss.
+        root: Root directory of the book project.
+        use_cache: If False, always load the book and leave the cache alone.
+
+    Returns:
+        The loaded Book.
+
+    Raises:
+        FileNotFoundError: If no book exists at root.
+        ValueError: If the book structure is invalid.
+    """
+    if not use_cache or cache_disabled():
+        return book_service.get_book_info(root)
+
+    # The book is loaded from root as given, so its paths are the same with
+    # or without the cache; only the cache location uses the real path
+    cache_path = Path(root).resolve() / CACHE_DIR_NAME / CACHE_FILE_NAME
+
+    book = _read_cache(cache_path, root)
+    if book is not None:
+        return book
+
+    book = book_service.get_book_info(root)
+    _write_cache(cache_path, book, root)
+    return book
+
+
+def _stat_key(path: str) -> list[int] | None:
+    """Get the (mtime_ns, size) fingerprint of a path.
+
+    Args:
+        path: The file or directory path.
+
+    Returns:
+        [mtime_ns, size], or None if the path can't be stat'ed.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _fingerprint(book: Book) -> dict[str, list[int] | None]:
+    """Build the stat fingerprint for a loaded book.
+
+    Args:
+        book: The book to fingerprint.
+
+    Returns:
+        Mapping of path to its (mtime_ns, size) or None if missing.
+    """
+    root = str(book.root_path)
+    paths = [os.path.join(root, rel) for rel in STRUCTURE_PATHS]
+    for chapter in book.chapters:
+        paths.append(str(chapter.file_path))
+        paths.append(str(chapter.file_path.parent))
+    paths.extend(_listed_paths(root))
+    paths.extend(_chapter_dir_paths(root))
+    return {path: _stat_key(path) for path in dict.fromkeys(paths)}
+
+
+def _listed_paths(root: str) -> list[str]:
+    """Collect every chapter path the structure files list, found or not.
+
+    StructureService skips listed chapters whose files don't exist, so
+    they are missing from the loaded book; fingerprinting every place they
+    are looked for means creating one later invalidates the cache.
+
+    Args:
+        root: The book root directory.
+
+    Returns:
+        Candidate chapter paths from SUMMARY.md, Book.txt and _bookdown.yml.
+    """
+    paths: list[str] = []
+
+    for summary in ("SUMMARY.md", os.path.join("src", "SUMMARY.md")):
+        summary_path = os.path.join(root, summary)
+        text = _read_text(summary_path)
+        if text is None:
+            continue
+        summary_dir = os.path.dirname(summary_path)
+        for line in text.split("\n"):
+            match = _SUMMARY_LINK.search(line)
+            if match:
+                rel_path = match.group(2).strip()
+                paths.append(os.path.join(root, rel_path))
+                paths.append(os.path.join(summary_dir, rel_path))
+
+    text = _read_text(os.path.join(root, "Book.txt"))
+    if text is not None:
+        manuscript = os.path.join(root, "manuscript")
+        for line in text.split("\n"):
+            line = line.strip()
+            if line and not line.startswith("#") and line not in _LEANPUB_MARKERS:
+                paths.append(os.path.join(manuscript, line))
+                paths.append(os.path.join(root, line))
+
+    text = _read_text(os.path.join(root, "_bookdown.yml"))
+    if text is not None:
+        import yaml
+
+        try:
+            rmd_files = (yaml.safe_load(text) or {}).get("rmd_files") or []
+        except (yaml.YAMLError, AttributeError):
+            rmd_files = []
+        for file_name in rmd_files:
+            if isinstance(file_name, str):
+                file_path = os.path.join(root, file_name)
+                paths.append(file_path)
+                paths.append(os.path.splitext(file_path)[0] + ".md")
+
+    return paths
+
+
+def _chapter_dir_paths(root: str) -> list[str]:
+    """Collect the chapter-* directories auto-detection looks in.
+
+    Adding a file to an existing directory doesn't change the root's
+    mtime, so a chapter directory with no loaded chapter yet, and its
+    content subdirectory, are fingerprinted themselves.
+
+    Args:
+        root: The book root directory.
+
+    Returns:
+        Every chapter-* entry in root and the content path inside each.
+    """
+    try:
+        with os.scandir(root) as it:
+            names = [entry.name for entry in it if entry.name.startswith("chapter-")]
+    except OSError:
+        return []
+
+    paths: list[str] = []
+    for name in names:
+        chapter_dir = os.path.join(root, name)
+        paths.append(chapter_dir)
+        paths.append(os.path.join(chapter_dir, "content"))
+    return paths
+
+
+def _read_text(path: str) -> str | None:
+    """Read a structure file, or None if it can't be read."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _read_cache(cache_path: Path, root: Path) -> Book | None:
+    """Load a cached book if the cache exists and is still fresh.
+
+    Args:
+        cache_path: Path to the cache file.
+        root: Root directory of the book, as passed to load_book_info.
+
+    Returns:
+        The cached Book, or None if there is no usable cache.
+    """
+    try:
+        data = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    try:
+        if data["version"] != CACHE_VERSION or data["root"] != str(root):
+            return None
+        for path, key in data["fingerprint"].items():
+            if _stat_key(path) != key:
+                return None
+        return _book_from_dict(data["book"])
+    except (KeyError, TypeError, ValueError):
+        # Corrupt or foreign cache file; rebuild it
+        return None
+
+
+def _write_cache(cache_path: Path, book: Book, root: Path) -> None:
+    """Persist a book to the cache, ignoring any failure.
+
+    The file is written to a temporary name and then renamed into place,
+    so concurrent invocations never see a partially written cache.
+
+    Args:
+        cache_path: Path to the cache file.
+        book: The book to store.
+        root: Root directory the book was loaded from, as passed to
+            load_book_info; a later load only hits the cache for the same root.
+    """
+    cache_dir = cache_path.parent
+    try:
+        # Create the directory before fingerprinting, since adding it
+        # changes the book root's mtime
+        cache_dir.mkdir(exist_ok=True)
+        gitignore = cache_dir / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("*\n", encoding="utf-8")
+    except OSError:
+        # Read-only or otherwise unwritable book directory
+        return
+
+    payload = {
+        "version": CACHE_VERSION,
+        "root": str(root),
+        "fingerprint": _fingerprint(book),
+        "book": _book_to_dict(book),
+    }
+
+    try:
+        text = json.dumps(payload)
+    except (TypeError, ValueError):
+        # Frontmatter holds values JSON can't represent; don't cache
+        return
+    if json.loads(text)["book"] != payload["book"]:
+        # Values would not round-trip unchanged (e.g. non-string keys)
+        return
+
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+def _date_to_str(value: date | None) -> str | None:
+    """Serialize a date or datetime to ISO format."""
+    return value.isoformat() if value is not None else None
+
+
+def _date_from_str(value: str | None) -> date | None:
+    """Parse a date or datetime written by _date_to_str."""
+    if value is None:
+        return None
+    if "T" in value:
+        return datetime.fromisoformat(value)
+    return date.fromisoformat(value)
+
+
+def _book_to_dict(book: Book) -> dict[str, Any]:
+    """Convert a book to JSON-compatible data.
+
+    Args:
+        book: The book to convert.
+
+    Returns:
+        Dict of plain values describing the book.
+    """
+    meta = book.metadata
+    return {
+        "root_path": str(book.root_path),
+        "metadata": {
+            "title": meta.title,
+            "author": meta.author,
+            "description": meta.description,
+            "language": meta.language,
+            "created": _date_to_str(meta.created),
+        },
+        "chapters": [
+            {
+                "file_path": str(ch.file_path),
+                "is_intro": ch.is_intro,
+                "metadata": {
+                    "title": ch.metadata.title,
+                    "number": ch.metadata.number,
+                    "author": ch.metadata.author,
+                    "date": _date_to_str(ch.metadata.date),
+                    "draft": ch.metadata.draft,
+                    "extra": ch.metadata.extra,
+                },
+            }
+            for ch in book.chapters
+        ],
+    }
+
+
+def _book_from_dict(data: dict[str, Any]) -> Book:
+    """Rebuild a book from data produced by _book_to_dict.
+
+    Args:
+        data: The stored book data.
+
+    Returns:
+        The reconstructed Book.
+    """
+    meta = data["metadata"]
+    chapters = []
+    for ch in data["chapters"]:
+        ch_meta = ch["metadata"]
+        chapters.append(
+            Chapter(
+                file_path=Path(ch["file_path"]),
+                metadata=ChapterMetadata(
+                    title=ch_meta["title"],
+                    number=ch_meta["number"],
+                    author=ch_meta["author"],
+                    date=_date_from_str(ch_meta["date"]),
+                    draft=ch_meta["draft"],
+                    extra=ch_meta["extra"],
+                ),
+                is_intro=ch["is_intro"],
+            )
+        )
+
+    return Book(
+        root_path=Path(data["root_path"]),
+        metadata=BookMetadata(
+            title=meta["title"],
+            author=meta["author"],
+            description=meta["description"],
+            language=meta["language"],
+            created=_date_from_str(meta["created"]),
+        ),
+        chapters=chapters,
+    )
@@ -0,0 +1,59 @@
+"""JSON encoding shared by the CLI and the MCP server.
+
+Uses orjson when the optional fast extra is installed and the standard
+library json module otherwise; both produce the same two-space indented
+output.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to JSON indented by two spaces.
+
+    Args:
+        obj: The value to serialize.
+        default: Called for values JSON can't represent; it should return
+            something that can be serialized.
+
+    Returns:
+        The JSON text, without a trailing newline.
+
+    Raises:
+        TypeError: If a value can't be serialized and default doesn't help.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            # orjson rejects some values json accepts, such as integers
+            # wider than 64 bits; let json have a go at them
+            pass
+    return json.dumps(obj, indent=2, default=default)
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The parsed value.
+
+    Raises:
+        ValueError: If data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,628 +5,646 @@ Exposes book operations (info, read, create, modify) as MCP tools.
 """
 
 import asyncio
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from ..infrastructure import configure_services
+from ..infrastructure import (
+    ServiceContainer,
+    configure_services,
+    json_dumps,
+    load_book_info,
+)
 from ..services import IBookService
 
 # Initialize MCP server
 server = Server("mdbook")
 
-# Lazy service container initialization
-_book_service: IBookService | None = None
 
+@lru_cache(maxsize=1)
+def get_container() -> ServiceContainer:
+    """Get the service container shared by all tool calls.
 
-def get_book_service() -> IBookService:
-    """Get or create the book service singleton.
+    The server is long-running, so wiring the services once lets every
+    tool call reuse the same singletons and their mtime-checked caches.
 
     Returns:
-        The configured IBookService instance.
+        The configured ServiceContainer.
     """
-    global _book_service
-    if _book_service is None:
-        container = configure_services()
-        _book_service = container.resolve(IBookService)
-    return _book_service
+    return configure_services()
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available MCP tools for book operations.
+def get_book_service() -> IBookService:
+    """Get the book service singleton.
 
     Returns:
-        List of Tool definitions with names, descriptions, and schemas.
+        The configured IBookService instance.
     """
-    return [
-        Tool(
-            name="book_info",
-            description="Get information about a markdown book including title, author, and chapter list.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                },
-                "required": ["path"],
+    return get_container().resolve(IBookService)
+
+
+# Tool definitions are static, so the list is built once at import and
+# the same list is returned for every tools/list request
+_TOOL_LIST: list[Tool] = [
+    Tool(
+        name="book_info",
+        description="Get information about a markdown book including title, author, and chapter list.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
             },
-        ),
-        Tool(
-            name="read_chapter",
-            description="Read the content of a specific chapter from a book.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number to read (0 for intro, 1+ for numbered chapters)",
-                    },
-                },
-                "required": ["path", "chapter"],
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="read_chapter",
+        description="Read the content of a specific chapter from a book.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number to read (0 for intro, 1+ for numbered chapters)",
+                },
             },
-        ),
-        Tool(
-            name="list_chapters",
-            description="List all chapters in a book with their metadata.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                },
-                "required": ["path"],
+            "required": ["path", "chapter"],
+        },
+    ),
+    Tool(
+        name="list_chapters",
+        description="List all chapters in a book with their metadata.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
             },
-        ),
-        Tool(
-            name="create_book",
-            description="Create a new book project with the specified title and author.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path where the book will be created",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "The book title",
-                    },
-                    "author": {
-                        "type": "string",
-                        "description": "The book author",
-                    },
-                },
-                "required": ["path", "title", "author"],
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="create_book",
+        description="Create a new book project with the specified title and author.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path where the book will be created",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "The book title",
+                },
+                "author": {
+                    "type": "string",
+                    "description": "The book author",
+                },
             },
-        ),
-        Tool(
-            name="add_chapter",
-            description="Add a new chapter to an existing book.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "The chapter title",
-                    },
-                    "draft": {
-                        "type": "boolean",
-                        "description": "Mark chapter as draft (default: false)",
-                        "default": False,
-                    },
-                },
-                "required": ["path", "title"],
+            "required": ["path", "title", "author"],
+        },
+    ),
+    Tool(
+        name="add_chapter",
+        description="Add a new chapter to an existing book.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "The chapter title",
+                },
+                "draft": {
+                    "type": "boolean",
+                    "description": "Mark chapter as draft (default: false)",
+                    "default": False,
+                },
             },
-        ),
-        Tool(
-            name="update_toc",
-            description="Update the table of contents (SUMMARY.md). By default preserves existing hierarchy.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "preserve_structure": {
-                        "type": "boolean",
-                        "description": "Preserve existing SUMMARY.md hierarchy and only add new files (default: true). Set to false to regenerate flat structure.",
-                        "default": True,
-                    },
-                },
-                "required": ["path"],
+            "required": ["path", "title"],
+        },
+    ),
+    Tool(
+        name="update_toc",
+        description="Update the table of contents (SUMMARY.md). By default preserves existing hierarchy.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "preserve_structure": {
+                    "type": "boolean",
+                    "description": "Preserve existing SUMMARY.md hierarchy and only add new files (default: true). Set to false to regenerate flat structure.",
+                    "default": True,
+                },
             },
-        ),
-        Tool(
-            name="list_sections",
-            description="List all sections (## headings) in a chapter.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                },
-                "required": ["path", "chapter"],
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="list_sections",
+        description="List all sections (## headings) in a chapter.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
             },
-        ),
-        Tool(
-            name="read_section",
-            description="Get section content by heading or index.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "section": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {"type": "integer"},
-                        ],
-                        "description": "Section identifier: heading text (partial match) or 0-based index",
-                    },
-                },
-                "required": ["path", "chapter", "section"],
+            "required": ["path", "chapter"],
+        },
+    ),
+    Tool(
+        name="read_section",
+        description="Get section content by heading or index.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "section": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "integer"},
+                    ],
+                    "description": "Section identifier: heading text (partial match) or 0-based index",
+                },
             },
-        ),
-        Tool(
-            name="update_section",
-            description="Replace section content (preserves heading).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "section": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {"type": "integer"},
-                        ],
-                        "description": "Section identifier: heading text (partial match) or 0-based index",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "New content for the section body (heading is preserved)",
-                    },
-                },
-                "required": ["path", "chapter", "section", "content"],
+            "required": ["path", "chapter", "section"],
+        },
+    ),
+    Tool(
+        name="update_section",
+        description="Replace section content (preserves heading).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "section": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "integer"},
+                    ],
+                    "description": "Section identifier: heading text (partial match) or 0-based index",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "New content for the section body (heading is preserved)",
+                },
             },
-        ),
-        Tool(
-            name="add_note",
-            description="Add timestamped HTML comment note to section.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "section": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {"type": "integer"},
-                        ],
-                        "description": "Section identifier: heading text (partial match) or 0-based index",
-                    },
-                    "note": {
-                        "type": "string",
-                        "description": "The note text to add",
-                    },
-                },
-                "required": ["path", "chapter", "section", "note"],
+            "required": ["path", "chapter", "section", "content"],
+        },
+    ),
+    Tool(
+        name="add_note",
+        description="Add timestamped HTML comment note to section.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "section": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "integer"},
+                    ],
+                    "description": "Section identifier: heading text (partial match) or 0-based index",
+                },
+                "note": {
+                    "type": "string",
+                    "description": "The note text to add",
+                },
             },
-        ),
-        Tool(
-            name="list_notes",
-            description="List all notes in a chapter.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                },
-                "required": ["path", "chapter"],
+            "required": ["path", "chapter", "section", "note"],
+        },
+    ),
+    Tool(
+        name="list_notes",
+        description="List all notes in a chapter.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
             },
-        ),
-        Tool(
-            name="build_book",
-            description="Render book to HTML with syntax highlighting, tables, mermaid diagrams.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "output_dir": {
-                        "type": "string",
-                        "description": "Output directory for HTML files (default: book/html)",
-                    },
-                },
-                "required": ["path"],
+            "required": ["path", "chapter"],
+        },
+    ),
+    Tool(
+        name="build_book",
+        description="Render book to HTML with syntax highlighting, tables, mermaid diagrams.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "output_dir": {
+                    "type": "string",
+                    "description": "Output directory for HTML files (default: book/html)",
+                },
             },
-        ),
-        Tool(
-            name="generate_toc",
-            description="Generate hierarchical table of contents from all headings.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "include_sections": {
-                        "type": "boolean",
-                        "description": "Include intra-chapter headings (default: false)",
-                        "default": False,
-                    },
-                },
-                "required": ["path"],
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="generate_toc",
+        description="Generate hierarchical table of contents from all headings.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "include_sections": {
+                    "type": "boolean",
+                    "description": "Include intra-chapter headings (default: false)",
+                    "default": False,
+                },
             },
-        ),
-        Tool(
-            name="generate_index",
-            description="Generate alphabetical index from {{index: term}} markers.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                },
-                "required": ["path"],
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="generate_index",
+        description="Generate alphabetical index from {{index: term}} markers.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
             },
-        ),
-        Tool(
-            name="validate_images",
-            description="Check that all referenced images exist.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                },
-                "required": ["path"],
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="validate_images",
+        description="Check that all referenced images exist.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
             },
-        ),
-        Tool(
-            name="extract_images",
-            description="List all image references in a chapter.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                },
-                "required": ["path", "chapter"],
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="extract_images",
+        description="List all image references in a chapter.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
             },
-        ),
-        Tool(
-            name="extract_mermaid",
-            description="Extract mermaid diagram blocks from a chapter.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                },
-                "required": ["path", "chapter"],
+            "required": ["path", "chapter"],
+        },
+    ),
+    Tool(
+        name="extract_mermaid",
+        description="Extract mermaid diagram blocks from a chapter.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
             },
-        ),
-        Tool(
-            name="update_chapter",
-            description="Replace full chapter content (preserves frontmatter). Creates backup by default.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "New content for the chapter body",
-                    },
-                    "dry_run": {
-                        "type": "boolean",
-                        "description": "If true, return diff without making changes (default: false)",
-                        "default": False,
-                    },
-                    "create_backup": {
-                        "type": "boolean",
-                        "description": "Create .bak backup file before editing (default: true)",
-                        "default": True,
-                    },
-                },
-                "required": ["path", "chapter", "content"],
+            "required": ["path", "chapter"],
+        },
+    ),
+    Tool(
+        name="update_chapter",
+        description="Replace full chapter content (preserves frontmatter). Creates backup by default.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "New content for the chapter body",
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If true, return diff without making changes (default: false)",
+                    "default": False,
+                },
+                "create_backup": {
+                    "type": "boolean",
+                    "description": "Create .bak backup file before editing (default: true)",
+                    "default": True,
+                },
             },
-        ),
-        Tool(
-            name="append_content",
-            description="Append content to the end of a chapter. Creates backup by default.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Content to append at the end of the chapter",
-                    },
-                    "dry_run": {
-                        "type": "boolean",
-                        "description": "If true, return diff without making changes (default: false)",
-                        "default": False,
-                    },
-                    "create_backup": {
-                        "type": "boolean",
-                        "description": "Create .bak backup file before editing (default: true)",
-                        "default": True,
-                    },
-                },
-                "required": ["path", "chapter", "content"],
+            "required": ["path", "chapter", "content"],
+        },
+    ),
+    Tool(
+        name="append_content",
+        description="Append content to the end of a chapter. Creates backup by default.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Content to append at the end of the chapter",
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If true, return diff without making changes (default: false)",
+                    "default": False,
+                },
+                "create_backup": {
+                    "type": "boolean",
+                    "description": "Create .bak backup file before editing (default: true)",
+                    "default": True,
+                },
             },
-        ),
-        Tool(
-            name="insert_section",
-            description="Insert content before or after a section. Creates backup by default.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "section": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {"type": "integer"},
-                        ],
-                        "description": "Section identifier: heading text (partial match) or 0-based index",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Content to insert (typically a new section with ## heading)",
-                    },
-                    "position": {
-                        "type": "string",
-                        "enum": ["before", "after"],
-                        "description": "Insert before or after the section (default: after)",
-                        "default": "after",
-                    },
-                    "dry_run": {
-                        "type": "boolean",
-                        "description": "If true, return diff without making changes (default: false)",
-                        "default": False,
-                    },
-                    "create_backup": {
-                        "type": "boolean",
-                        "description": "Create .bak backup file before editing (default: true)",
-                        "default": True,
-                    },
-                },
-                "required": ["path", "chapter", "section", "content"],
+            "required": ["path", "chapter", "content"],
+        },
+    ),
+    Tool(
+        name="insert_section",
+        description="Insert content before or after a section. Creates backup by default.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "section": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "integer"},
+                    ],
+                    "description": "Section identifier: heading text (partial match) or 0-based index",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Content to insert (typically a new section with ## heading)",
+                },
+                "position": {
+                    "type": "string",
+                    "enum": ["before", "after"],
+                    "description": "Insert before or after the section (default: after)",
+                    "default": "after",
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If true, return diff without making changes (default: false)",
+                    "default": False,
+                },
+                "create_backup": {
+                    "type": "boolean",
+                    "description": "Create .bak backup file before editing (default: true)",
+                    "default": True,
+                },
             },
-        ),
-        Tool(
-            name="replace_section",
-            description="Replace section content with new content (optionally preserves heading). Creates backup by default.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "section": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {"type": "integer"},
-                        ],
-                        "description": "Section identifier: heading text (partial match) or 0-based index",
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "New content for the section",
-                    },
-                    "preserve_heading": {
-                        "type": "boolean",
-                        "description": "Keep the original section heading (default: true)",
-                        "default": True,
-                    },
-                    "dry_run": {
-                        "type": "boolean",
-                        "description": "If true, return diff without making changes (default: false)",
-                        "default": False,
-                    },
-                    "create_backup": {
-                        "type": "boolean",
-                        "description": "Create .bak backup file before editing (default: true)",
-                        "default": True,
-                    },
-                },
-                "required": ["path", "chapter", "section", "content"],
+            "required": ["path", "chapter", "section", "content"],
+        },
+    ),
+    Tool(
+        name="replace_section",
+        description="Replace section content with new content (optionally preserves heading). Creates backup by default.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "section": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "integer"},
+                    ],
+                    "description": "Section identifier: heading text (partial match) or 0-based index",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "New content for the section",
+                },
+                "preserve_heading": {
+                    "type": "boolean",
+                    "description": "Keep the original section heading (default: true)",
+                    "default": True,
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "If true, return diff without making changes (default: false)",
+                    "default": False,
+                },
+                "create_backup": {
+                    "type": "boolean",
+                    "description": "Create .bak backup file before editing (default: true)",
+                    "default": True,
+                },
             },
-        ),
-        Tool(
-            name="get_chapter_history",
-            description="Get git commit history for a chapter file. Shows commits that modified the chapter.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of commits to return (default: 50)",
-                        "default": 50,
-                    },
-                },
-                "required": ["path", "chapter"],
+            "required": ["path", "chapter", "section", "content"],
+        },
+    ),
+    Tool(
+        name="get_chapter_history",
+        description="Get git commit history for a chapter file. Shows commits that modified the chapter.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of commits to return (default: 50)",
+                    "default": 50,
+                },
             },
-        ),
-        Tool(
-            name="get_chapter_diff",
-            description="Get diff between two versions of a chapter. Shows additions, deletions, and change hunks.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "commit_from": {
-                        "type": "string",
-                        "description": "Starting commit (older version). Default: HEAD~1",
-                        "default": "HEAD~1",
-                    },
-                    "commit_to": {
-                        "type": "string",
-                        "description": "Ending commit (newer version). Default: HEAD",
-                        "default": "HEAD",
-                    },
-                },
-                "required": ["path", "chapter"],
+            "required": ["path", "chapter"],
+        },
+    ),
+    Tool(
+        name="get_chapter_diff",
+        description="Get diff between two versions of a chapter. Shows additions, deletions, and change hunks.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "commit_from": {
+                    "type": "string",
+                    "description": "Starting commit (older version). Default: HEAD~1",
+                    "default": "HEAD~1",
+                },
+                "commit_to": {
+                    "type": "string",
+                    "description": "Ending commit (newer version). Default: HEAD",
+                    "default": "HEAD",
+                },
             },
-        ),
-        Tool(
-            name="get_chapter_at_commit",
-            description="Get the content of a chapter at a specific git commit.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "chapter": {
-                        "type": "integer",
-                        "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
-                    },
-                    "commit": {
-                        "type": "string",
-                        "description": "Commit reference (hash, branch, tag, HEAD~N). Default: HEAD",
-                        "default": "HEAD",
-                    },
-                },
-                "required": ["path", "chapter"],
+            "required": ["path", "chapter"],
+        },
+    ),
+    Tool(
+        name="get_chapter_at_commit",
+        description="Get the content of a chapter at a specific git commit.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "chapter": {
+                    "type": "integer",
+                    "description": "Chapter number (0 for intro, 1+ for numbered chapters)",
+                },
+                "commit": {
+                    "type": "string",
+                    "description": "Commit reference (hash, branch, tag, HEAD~N). Default: HEAD",
+                    "default": "HEAD",
+                },
             },
-        ),
-        Tool(
-            name="get_recent_changes",
-            description="Get recent changes across the entire book. Shows commits that modified .md files.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to the book directory",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of changes to return (default: 20)",
-                        "default": 20,
-                    },
-                },
-                "required": ["path"],
+            "required": ["path", "chapter"],
+        },
+    ),
+    Tool(
+        name="get_recent_changes",
+        description="Get recent changes across the entire book. Shows commits that modified .md files.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to the book directory",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of changes to return (default: 20)",
+                    "default": 20,
+                },
             },
-        ),
-    ]
+            "required": ["path"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available MCP tools for book operations.
+
+    Returns:
+        List of Tool definitions with names, descriptions, and schemas.
+    """
+    return _TOOL_LIST
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle MCP tool calls.
 
-    Routes tool calls to the appropriate book service methods.
+    Routes tool calls to their handlers through the _BOOK_HANDLERS and
+    _HANDLERS tables.
 
     Args:
         name: The tool name being called.
@@ -638,56 +656,10 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     book_service = get_book_service()
 
     try:
-        if name == "book_info":
-            result = await handle_book_info(book_service, arguments)
-        elif name == "read_chapter":
-            result = await handle_read_chapter(book_service, arguments)
-        elif name == "list_chapters":
-            result = await handle_list_chapters(book_service, arguments)
-        elif name == "create_book":
-            result = await handle_create_book(book_service, arguments)
-        elif name == "add_chapter":
-            result = await handle_add_chapter(book_service, arguments)
-        elif name == "update_toc":
-            result = await handle_update_toc(book_service, arguments)
-        elif name == "list_sections":
-            result = await handle_list_sections(book_service, arguments)
-        elif name == "read_section":
-            result = await handle_read_section(book_service, arguments)
-        elif name == "update_section":
-            result = await handle_update_section(book_service, arguments)
-        elif name == "add_note":
-            result = await handle_add_note(book_service, arguments)
-        elif name == "list_notes":
-            result = await handle_list_notes(book_service, arguments)
-        elif name == "build_book":
-            result = await handle_build_book(arguments)
-        elif name == "generate_toc":
-            result = await handle_generate_toc(arguments)
-        elif name == "generate_index":
-            result = await handle_generate_index(arguments)
-        elif name == "validate_images":
-            result = await handle_validate_images(arguments)
-        elif name == "extract_images":
-            result = await handle_extract_images(arguments)
-        elif name == "extract_mermaid":
-            result = await handle_extract_mermaid(arguments)
-        elif name == "update_chapter":
-            result = await handle_update_chapter(arguments)
-        elif name == "append_content":
-            result = await handle_append_content(arguments)
-        elif name == "insert_section":
-            result = await handle_insert_section(arguments)
-        elif name == "replace_section":
-            result = await handle_replace_section(arguments)
-        elif name == "get_chapter_history":
-            result = await handle_get_chapter_history(book_service, arguments)
-        elif name == "get_chapter_diff":
-            result = await handle_get_chapter_diff(book_service, arguments)
-        elif name == "get_chapter_at_commit":
-            result = await handle_get_chapter_at_commit(book_service, arguments)
-        elif name == "get_recent_changes":
-            result = await handle_get_recent_changes(arguments)
+        if name in _BOOK_HANDLERS:
+            result = await _BOOK_HANDLERS[name](book_service, arguments)
+        elif name in _HANDLERS:
+            result = await _HANDLERS[name](arguments)
         else:
             result = {"error": f"Unknown tool: {name}"}
     except FileNotFoundError as e:
@@ -703,12 +675,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     except Exception as e:
         result = {"error": f"Unexpected error: {type(e).__name__}: {e}"}
 
-    # Format result as JSON-like string for readability
-    import json
-
-    text = json.dumps(result, indent=2, default=str)
-
-    return [TextContent(type="text", text=text)]
+    # Values JSON can't hold, such as paths, are written as strings
+    return [TextContent(type="text", text=json_dumps(result, default=str))]
 
 
 async def handle_book_info(
@@ -725,7 +693,7 @@ async def handle_book_info(
         Dictionary with book information.
     """
     path = Path(arguments["path"]).resolve()
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
 
     return {
         "title": book.metadata.title,
@@ -765,7 +733,7 @@ async def handle_read_chapter(
     content = book_service.read_chapter(path, chapter_num)
 
     # Also get chapter metadata for context
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     chapter = book.get_chapter(chapter_num)
 
     result: dict[str, Any] = {"content": content}
@@ -885,7 +853,7 @@ async def handle_update_toc(
     book_service.update_toc(path, preserve_structure)
 
     # Get updated book info to confirm
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
 
     return {
         "success": True,
@@ -1048,11 +1016,11 @@ async def handle_build_book(arguments: dict[str, Any]) -> dict[str, Any]:
     else:
         output_path = path / "html"
 
-    container = configure_services()
+    container = get_container()
     book_service = container.resolve(IBookService)
     render_service = container.resolve(RenderService)
 
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     generated = render_service.render_book(book, output_path)
 
     return {
@@ -1077,11 +1045,11 @@ async def handle_generate_toc(arguments: dict[str, Any]) -> dict[str, Any]:
     path = Path(arguments["path"]).resolve()
     include_sections = arguments.get("include_sections", False)
 
-    container = configure_services()
+    container = get_container()
     book_service = container.resolve(IBookService)
     toc_service = container.resolve(TocService)
 
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     toc_md = toc_service.generate_toc_markdown(
         book, include_chapter_tocs=include_sections
     )
@@ -1105,11 +1073,11 @@ async def handle_generate_index(arguments: dict[str, Any]) -> dict[str, Any]:
 
     path = Path(arguments["path"]).resolve()
 
-    container = configure_services()
+    container = get_container()
     book_service = container.resolve(IBookService)
     index_service = container.resolve(IndexService)
 
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     index = index_service.build_index(book)
 
     return {
@@ -1132,12 +1100,12 @@ async def handle_validate_images(arguments: dict[str, Any]) -> dict[str, Any]:
 
     path = Path(arguments["path"]).resolve()
 
-    container = configure_services()
+    container = get_container()
     book_service = container.resolve(IBookService)
     content_service = container.resolve(ContentService)
     reader_service = container.resolve(IReaderService)
 
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     missing_images = []
 
     for chapter in book.chapters:
@@ -1175,12 +1143,12 @@ async def handle_extract_images(arguments: dict[str, Any]) -> dict[str, Any]:
     path = Path(arguments["path"]).resolve()
     chapter_num = arguments["chapter"]
 
-    container = configure_services()
+    container = get_container()
     book_service = container.resolve(IBookService)
     content_service = container.resolve(ContentService)
     reader_service = container.resolve(IReaderService)
 
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     chapter = book.get_chapter(chapter_num)
 
     if chapter is None:
@@ -1219,12 +1187,12 @@ async def handle_extract_mermaid(arguments: dict[str, Any]) -> dict[str, Any]:
     path = Path(arguments["path"]).resolve()
     chapter_num = arguments["chapter"]
 
-    container = configure_services()
+    container = get_container()
     book_service = container.resolve(IBookService)
     content_service = container.resolve(ContentService)
     reader_service = container.resolve(IReaderService)
 
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     chapter = book.get_chapter(chapter_num)
 
     if chapter is None:
@@ -1267,7 +1235,7 @@ async def handle_update_chapter(arguments: dict[str, Any]) -> dict[str, Any]:
     dry_run = arguments.get("dry_run", False)
     create_backup = arguments.get("create_backup", True)
 
-    container = configure_services()
+    container = get_container()
     writer_service = container.resolve(IWriterService)
     reader_service = container.resolve(IReaderService)
 
@@ -1301,7 +1269,7 @@ async def handle_append_content(arguments: dict[str, Any]) -> dict[str, Any]:
     dry_run = arguments.get("dry_run", False)
     create_backup = arguments.get("create_backup", True)
 
-    container = configure_services()
+    container = get_container()
     writer_service = container.resolve(IWriterService)
     reader_service = container.resolve(IReaderService)
 
@@ -1337,7 +1305,7 @@ async def handle_insert_section(arguments: dict[str, Any]) -> dict[str, Any]:
     dry_run = arguments.get("dry_run", False)
     create_backup = arguments.get("create_backup", True)
 
-    container = configure_services()
+    container = get_container()
     writer_service = container.resolve(IWriterService)
     reader_service = container.resolve(IReaderService)
 
@@ -1375,7 +1343,7 @@ async def handle_replace_section(arguments: dict[str, Any]) -> dict[str, Any]:
     dry_run = arguments.get("dry_run", False)
     create_backup = arguments.get("create_backup", True)
 
-    container = configure_services()
+    container = get_container()
     writer_service = container.resolve(IWriterService)
     reader_service = container.resolve(IReaderService)
 
@@ -1412,14 +1380,14 @@ async def handle_get_chapter_history(
     chapter_num = arguments["chapter"]
     limit = arguments.get("limit", 50)
 
-    container = configure_services()
+    container = get_container()
     git_service = container.resolve(GitService)
 
     # Check if this is a git repo
     if not git_service.is_git_repo(path):
         return {"error": f"Not a git repository: {path}"}
 
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     chapter = book.get_chapter(chapter_num)
 
     if chapter is None:
@@ -1468,14 +1436,14 @@ async def handle_get_chapter_diff(
     commit_from = arguments.get("commit_from", "HEAD~1")
     commit_to = arguments.get("commit_to", "HEAD")
 
-    container = configure_services()
+    container = get_container()
     git_service = container.resolve(GitService)
 
     # Check if this is a git repo
     if not git_service.is_git_repo(path):
         return {"error": f"Not a git repository: {path}"}
 
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     chapter = book.get_chapter(chapter_num)
 
     if chapter is None:
@@ -1525,14 +1493,14 @@ async def handle_get_chapter_at_commit(
     chapter_num = arguments["chapter"]
     commit = arguments.get("commit", "HEAD")
 
-    container = configure_services()
+    container = get_container()
     git_service = container.resolve(GitService)
 
     # Check if this is a git repo
     if not git_service.is_git_repo(path):
         return {"error": f"Not a git repository: {path}"}
 
-    book = book_service.get_book_info(path)
+    book = load_book_info(book_service, path)
     chapter = book.get_chapter(chapter_num)
 
     if chapter is None:
@@ -1562,7 +1530,7 @@ async def handle_get_recent_changes(arguments: dict[str, Any]) -> dict[str, Any]
     path = Path(arguments["path"]).resolve()
     limit = arguments.get("limit", 20)
 
-    container = configure_services()
+    container = get_container()
     git_service = container.resolve(GitService)
 
     # Check if this is a git repo
@@ -1591,6 +1559,42 @@ async def handle_get_recent_changes(arguments: dict[str, Any]) -> dict[str, Any]
     }
 
 
+# Tool name to handler, for handlers that take the book service
+_BOOK_HANDLERS: dict[
+    str, Callable[[IBookService, dict[str, Any]], Awaitable[dict[str, Any]]]
+] = {
+    "book_info": handle_book_info,
+    "read_chapter": handle_read_chapter,
+    "list_chapters": handle_list_chapters,
+    "create_book": handle_create_book,
+    "add_chapter": handle_add_chapter,
+    "update_toc": handle_update_toc,
+    "list_sections": handle_list_sections,
+    "read_section": handle_read_section,
+    "update_section": handle_update_section,
+    "add_note": handle_add_note,
+    "list_notes": handle_list_notes,
+    "get_chapter_history": handle_get_chapter_history,
+    "get_chapter_diff": handle_get_chapter_diff,
+    "get_chapter_at_commit": handle_get_chapter_at_commit,
+}
+
+# Tool name to handler, for handlers that resolve their own services
+_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]] = {
+    "build_book": handle_build_book,
+    "generate_toc": handle_generate_toc,
+    "generate_index": handle_generate_index,
+    "validate_images": handle_validate_images,
+    "extract_images": handle_extract_images,
+    "extract_mermaid": handle_extract_mermaid,
+    "update_chapter": handle_update_chapter,
+    "append_content": handle_append_content,
+    "insert_section": handle_insert_section,
+    "replace_section": handle_replace_section,
+    "get_recent_changes": handle_get_recent_changes,
+}
+
+
 async def run_server_async() -> None:
     """Run the MCP server using stdio transport."""
     async with stdio_server() as (read_stream, write_stream):
@@ -7,13 +7,9 @@ import sys
 from pathlib import Path
 from typing import Any
 
-# Python 3.11+ has tomllib built-in, older versions need tomli
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
-
-import yaml
+# yaml and tomllib are imported where used: most commands parse at most
+# one config format, and importing yaml alone is a noticeable share of
+# CLI startup.
 
 
 class ConfigRepository:
@@ -47,6 +43,8 @@ class ConfigRepository:
             FileNotFoundError: If the file does not exist.
             yaml.YAMLError: If the YAML is invalid.
         """
+        import yaml
+
         with open(path, "r", encoding=self._encoding) as f:
             data = yaml.safe_load(f)
             # safe_load returns None for empty files
@@ -65,6 +63,12 @@ class ConfigRepository:
             FileNotFoundError: If the file does not exist.
             tomllib.TOMLDecodeError: If the TOML is invalid.
         """
+        # Python 3.11+ has tomllib built-in, older versions need tomli
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
         with open(path, "rb") as f:
             return tomllib.load(f)
 
@@ -81,6 +85,8 @@ class ConfigRepository:
         Raises:
             PermissionError: If write permission is denied.
         """
+        import yaml
+
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -3,6 +3,10 @@
 Provides concrete file system operations through Python's pathlib module.
 """
 
+import mmap
+import os
+from fnmatch import fnmatch
+from itertools import islice
 from pathlib import Path
 
 
@@ -13,6 +17,10 @@ class FileRepository:
     All operations use pathlib.Path for cross-platform compatibility.
     """
 
+    # Files at least this large are decoded straight from a memory map;
+    # below it, setting up the mapping costs more than the copy it saves
+    MMAP_THRESHOLD = 64 * 1024
+
     def __init__(self, encoding: str = "utf-8") -> None:
         """Initialize the file repository.
 
@@ -34,7 +42,36 @@ class FileRepository:
             FileNotFoundError: If the file does not exist.
             PermissionError: If read permission is denied.
         """
-        return path.read_text(encoding=self._encoding)
+        # One bulk read and decode instead of going through TextIOWrapper;
+        # newlines are normalized the same way text mode would
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size >= self.MMAP_THRESHOLD:
+                # Decode from the page cache without an intermediate bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = str(mm, self._encoding)
+            else:
+                content = f.read().decode(self._encoding)
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+    def read_head(self, path: Path, max_lines: int) -> str:
+        """Read at most the first lines of a file as a string.
+
+        Args:
+            path: Path to the file to read.
+            max_lines: Maximum number of lines to read.
+
+        Returns:
+            The leading lines of the file, with newlines normalized as in
+            read_file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            PermissionError: If read permission is denied.
+        """
+        with path.open(encoding=self._encoding) as f:
+            return "".join(islice(f, max_lines))
 
     def write_file(self, path: Path, content: str) -> None:
         """Write content to a file, creating it if it doesn't exist.
@@ -67,12 +104,41 @@ class FileRepository:
         Raises:
             NotADirectoryError: If the path is not a directory.
         """
-        if not directory.is_dir():
-            raise NotADirectoryError(f"Not a directory: {directory}")
+        if "**" in pattern or "/" in pattern or os.sep in pattern:
+            if not directory.is_dir():
+                raise NotADirectoryError(f"Not a directory: {directory}")
+
+            # Use glob and filter to only include files
+            matches = [p for p in directory.glob(pattern) if p.is_file()]
+            return sorted(matches)
 
-        # Use glob and filter to only include files
-        matches = [p for p in directory.glob(pattern) if p.is_file()]
-        return sorted(matches)
+        return [directory / name for name in self.list_names(directory, pattern)]
+
+    def list_names(self, directory: Path, pattern: str = "*") -> list[str]:
+        """List names of files directly in a directory matching a pattern.
+
+        Cheaper than list_files when callers only need to inspect names,
+        since no Path objects are built.
+
+        Args:
+            directory: The directory to search in.
+            pattern: Non-recursive glob pattern for filtering (default: "*").
+
+        Returns:
+            A sorted list of file names (files only).
+
+        Raises:
+            NotADirectoryError: If the path is not a directory.
+        """
+        # One scandir pass, reusing the cached d_type from each entry
+        # instead of a stat per match
+        try:
+            with os.scandir(directory) as it:
+                names = [e.name for e in it if fnmatch(e.name, pattern) and e.is_file()]
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise NotADirectoryError(f"Not a directory: {directory}") from e
+
+        return sorted(names)
 
     def exists(self, path: Path) -> bool:
         """Check if a path exists.
@@ -32,6 +32,23 @@ class IFileRepository(Protocol):
         """
         ...
 
+    def read_head(self, path: Path, max_lines: int) -> str:
+        """Read at most the first lines of a file as a string.
+
+        Args:
+            path: Path to the file to read.
+            max_lines: Maximum number of lines to read.
+
+        Returns:
+            The leading lines of the file, with newlines normalized as in
+            read_file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            PermissionError: If read permission is denied.
+        """
+        ...
+
     def write_file(self, path: Path, content: str) -> None:
         """Write content to a file, creating it if it doesn't exist.
 
@@ -60,6 +77,21 @@ class IFileRepository(Protocol):
         """
         ...
 
+    def list_names(self, directory: Path, pattern: str = "*") -> list[str]:
+        """List names of files directly in a directory matching a pattern.
+
+        Args:
+            directory: The directory to search in.
+            pattern: Non-recursive glob pattern for filtering (default: "*").
+
+        Returns:
+            A sorted list of file names (files only).
+
+        Raises:
+            NotADirectoryError: If the path is not a directory.
+        """
+        ...
+
     def exists(self, path: Path) -> bool:
         """Check if a path exists.
 
@@ -63,7 +63,7 @@ class BookService:
             FileNotFoundError: If the book or chapter doesn't exist.
             KeyError: If no chapter with that number exists.
         """
-        book = self._reader.load_book(root)
+        book = self._reader.load_book(root, lazy=True)
         return self._reader.read_chapter(book, number)
 
     def list_chapters(self, root: Path) -> list[Chapter]:
@@ -53,6 +53,9 @@ class ContentService:
         """
         images: list[ImageRef] = []
         lines = content.split("\n")
+        # Existence per referenced path, so an image used several times
+        # in the chapter is resolved and checked only once
+        checked: dict[str, bool] = {}
 
         for line_num, line in enumerate(lines, start=1):
             for match in self.IMAGE_PATTERN.finditer(line):
@@ -74,8 +77,12 @@ class ContentService:
                 # Resolve relative path
                 exists = True
                 if validate:
-                    resolved_path = self._resolve_image_path(img_path, chapter_path)
-                    exists = self._file_repo.exists(resolved_path)
+                    exists = checked.get(img_path)
+                    if exists is None:
+                        resolved_path = self._resolve_image_path(img_path, chapter_path)
+                        exists = checked[img_path] = self._file_repo.exists(
+                            resolved_path
+                        )
 
                 images.append(
                     ImageRef(
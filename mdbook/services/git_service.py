@@ -5,10 +5,13 @@ including commit history, diffs between versions, and content
 at specific commits.
 """
 
+import os
 import re
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 from ..domain import (
     CommitInfo,
@@ -30,9 +33,20 @@ class GitService:
     # Fields: hash, short_hash, author, email, timestamp, subject, body
     LOG_FORMAT = "%H%n%h%n%an%n%ae%n%at%n%s%n%b%n---COMMIT_END---"
 
+    # Environment variables that point git somewhere other than the nearest
+    # .git entry or limit how far up it looks; when any is set, git itself
+    # is asked where the repository is
+    GIT_DISCOVERY_ENV = (
+        "GIT_DIR",
+        "GIT_WORK_TREE",
+        "GIT_CEILING_DIRECTORIES",
+        "GIT_DISCOVERY_ACROSS_FILESYSTEM",
+    )
+
     def __init__(self) -> None:
         """Initialize the git service."""
-        pass
+        # Directory -> work tree root found by walking up to a .git entry
+        self._repo_roots: dict[Path, Path] = {}
 
     def is_git_repo(self, path: Path) -> bool:
         """Check if a path is inside a git repository.
@@ -43,6 +57,9 @@ class GitService:
         Returns:
             True if the path is inside a git repo.
         """
+        if self._find_work_tree(path) is not None:
+            return True
+
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "--git-dir"],
@@ -64,6 +81,10 @@ class GitService:
         Returns:
             The repository root path, or None if not a git repo.
         """
+        root = self._find_work_tree(path)
+        if root is not None:
+            return root
+
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "--show-toplevel"],
@@ -78,6 +99,39 @@ class GitService:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return None
 
+    def _find_work_tree(self, path: Path) -> Path | None:
+        """Find the work tree containing a path without running git.
+
+        Walks up from the path to the nearest directory holding a .git
+        directory or file (worktrees and submodules use a file), which is
+        where git itself would stop. Found roots are cached per directory
+        and dropped once their .git entry is gone; misses aren't cached, so
+        a repository created later is still found.
+
+        Args:
+            path: A file or directory path.
+
+        Returns:
+            The work tree root, or None if none was found or the
+            environment overrides repository discovery.
+        """
+        if any(name in os.environ for name in self.GIT_DISCOVERY_ENV):
+            return None
+
+        start = (path if path.is_dir() else path.parent).resolve()
+        root = self._repo_roots.get(start)
+        if root is not None:
+            if (root / ".git").exists():
+                return root
+            # Removed or moved since it was found
+            del self._repo_roots[start]
+
+        for candidate in (start, *start.parents):
+            if (candidate / ".git").exists():
+                self._repo_roots[start] = candidate
+                return candidate
+        return None
+
     def get_chapter_history(
         self,
         chapter_path: Path,
@@ -157,20 +211,7 @@ class GitService:
             FileNotFoundError: If the chapter file doesn't exist.
             ValueError: If the path is not in a git repository.
         """
-        if not chapter_path.exists():
-            raise FileNotFoundError(f"Chapter not found: {chapter_path}")
-
-        if not self.is_git_repo(chapter_path):
-            raise ValueError(f"Not a git repository: {chapter_path}")
-
-        repo_root = self.get_repo_root(chapter_path)
-        if repo_root is None:
-            raise ValueError(f"Cannot find git repository root for: {chapter_path}")
-
-        try:
-            rel_path = chapter_path.resolve().relative_to(repo_root)
-        except ValueError:
-            rel_path = chapter_path
+        repo_root, rel_path = self._resolve_diff_path(chapter_path)
 
         try:
             result = subprocess.run(
@@ -212,6 +253,96 @@ class GitService:
             commit_to,
         )
 
+    def iter_chapter_diff(
+        self,
+        chapter_path: Path,
+        commit_from: str = "HEAD~1",
+        commit_to: str = "HEAD",
+    ) -> Iterator[str]:
+        """Stream the raw diff between two versions of a chapter.
+
+        Lines are read from git's stdout as it produces them, so large
+        diffs are never held in memory whole. The path is checked before
+        returning; git failures simply yield no lines.
+
+        Args:
+            chapter_path: Path to the chapter markdown file.
+            commit_from: Starting commit (older version).
+            commit_to: Ending commit (newer version).
+
+        Returns:
+            Iterator over the diff lines, each ending with a newline.
+
+        Raises:
+            FileNotFoundError: If the chapter file doesn't exist.
+            ValueError: If the path is not in a git repository.
+        """
+        repo_root, rel_path = self._resolve_diff_path(chapter_path)
+        return self._stream_diff(repo_root, rel_path, commit_from, commit_to)
+
+    def _resolve_diff_path(self, chapter_path: Path) -> tuple[Path, Path]:
+        """Locate a chapter's repository and its path relative to it.
+
+        Args:
+            chapter_path: Path to the chapter markdown file.
+
+        Returns:
+            Tuple of (repository root, chapter path relative to the root).
+
+        Raises:
+            FileNotFoundError: If the chapter file doesn't exist.
+            ValueError: If the path is not in a git repository.
+        """
+        if not chapter_path.exists():
+            raise FileNotFoundError(f"Chapter not found: {chapter_path}")
+
+        if not self.is_git_repo(chapter_path):
+            raise ValueError(f"Not a git repository: {chapter_path}")
+
+        repo_root = self.get_repo_root(chapter_path)
+        if repo_root is None:
+            raise ValueError(f"Cannot find git repository root for: {chapter_path}")
+
+        try:
+            rel_path = chapter_path.resolve().relative_to(repo_root)
+        except ValueError:
+            rel_path = chapter_path
+
+        return repo_root, rel_path
+
+    def _stream_diff(
+        self, repo_root: Path, rel_path: Path, commit_from: str, commit_to: str
+    ) -> Iterator[str]:
+        """Run git diff and yield its output line by line.
+
+        Git is killed if it runs longer than the 30 second timeout the
+        other diff commands use, which ends the output early.
+
+        Args:
+            repo_root: The repository root to run git in.
+            rel_path: The file to diff, relative to repo_root.
+            commit_from: Starting commit.
+            commit_to: Ending commit.
+
+        Yields:
+            Diff lines, each ending with a newline.
+        """
+        with subprocess.Popen(
+            ["git", "diff", commit_from, commit_to, "--", str(rel_path)],
+            cwd=repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ) as proc:
+            # A timer rather than a deadline check between lines, since a
+            # stuck git blocks the read itself
+            watchdog = threading.Timer(30, proc.kill)
+            watchdog.start()
+            try:
+                yield from proc.stdout
+            finally:
+                watchdog.cancel()
+
     def get_chapter_at_commit(
         self,
         chapter_path: Path,
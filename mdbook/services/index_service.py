@@ -8,7 +8,7 @@ import re
 from collections import defaultdict
 
 from ..domain import Book, Chapter
-from ..domain.content import IndexTerm, IndexEntry, BookIndex
+from ..domain.content import IndexTerm, IndexEntry, BookIndex, slugify
 from .interfaces import IReaderService
 
 
@@ -111,10 +111,10 @@ class IndexService:
                 )
             )
 
-        # Sort alphabetically
-        entries.sort(key=lambda e: e.sort_key)
-
-        return BookIndex(entries=entries)
+        # BookIndex sorts the entries alphabetically
+        index = BookIndex(entries=entries)
+        index.freeze()
+        return index
 
     def generate_index_markdown(self, book: Book) -> str:
         """Generate markdown index for the book.
@@ -151,10 +151,7 @@ class IndexService:
         Returns:
             URL-friendly anchor string.
         """
-        text = text.lower().strip()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[\s_-]+", "-", text)
-        return text.strip("-")
+        return slugify(text)
 
     def _strip_frontmatter(self, content: str) -> str:
         """Strip YAML frontmatter from content.
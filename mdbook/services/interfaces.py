@@ -35,7 +35,9 @@ class IStructureService(Protocol):
         """
         ...
 
-    def parse_structure(self, root: Path, format: FormatType) -> list[Chapter]:
+    def parse_structure(
+        self, root: Path, format: FormatType, lazy: bool = False
+    ) -> list[Chapter]:
         """Parse the book structure and return ordered chapters.
 
         Reads the table of contents or directory structure to build
@@ -44,6 +46,8 @@ class IStructureService(Protocol):
         Args:
             root: Root directory of the book project.
             format: The book format type to use for parsing.
+            lazy: If True, defer reading each chapter's frontmatter and
+                title until its metadata is first accessed.
 
         Returns:
             A list of Chapter objects in reading order.
@@ -80,7 +84,7 @@ class IReaderService(Protocol):
     Provides functionality to load books and read chapter content.
     """
 
-    def load_book(self, root: Path) -> Book:
+    def load_book(self, root: Path, lazy: bool = False) -> Book:
         """Load a book from a directory.
 
         Detects the format, parses structure, and loads metadata
@@ -88,6 +92,8 @@ class IReaderService(Protocol):
 
         Args:
             root: Root directory of the book project.
+            lazy: If True, chapter metadata is read on first access
+                instead of up front.
 
         Returns:
             A fully populated Book object.
@@ -128,6 +134,20 @@ class IReaderService(Protocol):
         """
         ...
 
+    def get_chapter_body(self, chapter: Chapter) -> str:
+        """Read a chapter's content with YAML frontmatter stripped.
+
+        Args:
+            chapter: The Chapter object to read.
+
+        Returns:
+            The markdown content of the chapter without frontmatter.
+
+        Raises:
+            FileNotFoundError: If the chapter file doesn't exist.
+        """
+        ...
+
     def parse_sections(self, content: str) -> list[Section]:
         """Parse markdown content into sections by ## headings.
 
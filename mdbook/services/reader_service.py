@@ -4,7 +4,10 @@ Provides functionality to load books and read chapter content using
 constructor injection for dependencies.
 """
 
+import os
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 
@@ -20,6 +23,9 @@ class ReaderService:
     for all dependencies, enabling easy testing and flexibility.
     """
 
+    # Maximum number of chapter files kept in the content cache
+    CONTENT_CACHE_SIZE = 16
+
     def __init__(
         self,
         file_repo: IFileRepository,
@@ -36,8 +42,12 @@ class ReaderService:
         self._file_repo = file_repo
         self._config_repo = config_repo
         self._structure_service = structure_service
+        # path -> (st_mtime_ns, st_size, content), least recently used first
+        self._content_cache: OrderedDict[Path, tuple[int, int, str]] = OrderedDict()
+        # Guards the cache so chapters can be prefetched from another thread
+        self._content_lock = threading.Lock()
 
-    def load_book(self, root: Path) -> Book:
+    def load_book(self, root: Path, lazy: bool = False) -> Book:
         """Load a book from a directory.
 
         Detects the format, parses structure, and loads metadata
@@ -45,6 +55,8 @@ class ReaderService:
 
         Args:
             root: Root directory of the book project.
+            lazy: If True, chapter metadata is read on first access
+                instead of up front. Useful when only one chapter is needed.
 
         Returns:
             A fully populated Book object.
@@ -65,7 +77,9 @@ class ReaderService:
         format_type = self._structure_service.detect_format(root)
 
         # Parse chapters from the structure
-        chapters = self._structure_service.parse_structure(root, format_type)
+        chapters = self._structure_service.parse_structure(
+            root, format_type, lazy=lazy
+        )
 
         # Load book metadata from config files
         metadata = self._load_metadata(root, format_type)
@@ -99,14 +113,31 @@ class ReaderService:
         if chapter is None:
             raise KeyError(f"Chapter {number} not found in book")
 
-        content = self.get_chapter_content(chapter)
+        return self.get_chapter_body(chapter)
+
+    def get_chapter_body(self, chapter: Chapter) -> str:
+        """Read a chapter's content with YAML frontmatter stripped.
+
+        Use this instead of read_chapter when the Chapter is already at
+        hand, to skip looking it up by number.
+
+        Args:
+            chapter: The Chapter object to read.
 
-        # Strip YAML frontmatter from content
-        return self._strip_frontmatter(content)
+        Returns:
+            The markdown content of the chapter without frontmatter.
+
+        Raises:
+            FileNotFoundError: If the chapter file doesn't exist.
+        """
+        return self._strip_frontmatter(self.get_chapter_content(chapter))
 
     def get_chapter_content(self, chapter: Chapter) -> str:
         """Read the raw content of a specific chapter.
 
+        Content is cached per file and reused while the file's mtime and
+        size are unchanged, so revisiting a chapter doesn't re-read it.
+
         Args:
             chapter: The Chapter object to read.
 
@@ -116,10 +147,34 @@ class ReaderService:
         Raises:
             FileNotFoundError: If the chapter file doesn't exist.
         """
-        if not self._file_repo.exists(chapter.file_path):
-            raise FileNotFoundError(f"Chapter file not found: {chapter.file_path}")
+        path = chapter.file_path
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Not statable on the local file system; read without caching
+            st = None
+
+        if st is not None:
+            with self._content_lock:
+                cached = self._content_cache.get(path)
+                if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                    self._content_cache.move_to_end(path)
+                    return cached[2]
 
-        return self._file_repo.read_file(chapter.file_path)
+        try:
+            content = self._file_repo.read_file(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Chapter file not found: {path}") from None
+
+        if st is not None:
+            with self._content_lock:
+                self._content_cache[path] = (st.st_mtime_ns, st.st_size, content)
+                self._content_cache.move_to_end(path)
+                if len(self._content_cache) > self.CONTENT_CACHE_SIZE:
+                    self._content_cache.popitem(last=False)
+
+        return content
 
     def _strip_frontmatter(self, content: str) -> str:
         """Strip YAML frontmatter from markdown content.
@@ -389,12 +444,10 @@ class ReaderService:
             FileNotFoundError: If the book or chapter doesn't exist.
             KeyError: If no chapter with that index exists.
         """
-        book = self.load_book(book_path)
+        book = self.load_book(book_path, lazy=True)
         chapter = book.get_chapter(chapter_index)
 
         if chapter is None:
             raise KeyError(f"Chapter {chapter_index} not found in book")
 
-        content = self.get_chapter_content(chapter)
-        content = self._strip_frontmatter(content)
-        return self.parse_sections(content)
+        return self.parse_sections(self.get_chapter_body(chapter))
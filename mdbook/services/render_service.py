@@ -5,20 +5,21 @@ pymdown-extensions for enhanced features like tables, footnotes,
 task lists, and code highlighting.
 """
 
+from __future__ import annotations
+
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
-
-import markdown
-from markdown.extensions.codehilite import CodeHiliteExtension
-from markdown.extensions.fenced_code import FencedCodeExtension
-from markdown.extensions.tables import TableExtension
-from markdown.extensions.toc import TocExtension
+from typing import TYPE_CHECKING, Iterator, Optional
 
 from ..domain import Book, Chapter
+from ..domain.content import slugify
 from ..repositories.interfaces import IFileRepository
 from .interfaces import IReaderService
 
+if TYPE_CHECKING:
+    import markdown
+
 
 # Mermaid.js CDN URL
 MERMAID_CDN = "https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.esm.min.mjs"
@@ -410,6 +411,124 @@ MERMAID_SCRIPT = """
 </script>
 """
 
+# Static page fragments, formatted once at import rather than per chapter
+MERMAID_SCRIPT_HTML = MERMAID_SCRIPT.format(mermaid_cdn=MERMAID_CDN)
+THEME_ONLY_NAV_HTML = f'<nav class="page-nav">{THEME_SWITCHER_HTML}</nav>'
+
+
+def _mermaid_format(
+    source: str,
+    language: str,
+    css_class: str,
+    options: dict,
+    md: markdown.Markdown,
+    **kwargs,
+) -> str:
+    """Custom formatter for mermaid code blocks."""
+    return f'<div class="mermaid">\n{source}\n</div>'
+
+
+def _slugify(value: str, separator: str = "-") -> str:
+    """Convert heading text to URL-friendly slug."""
+    slug = slugify(value)
+    return slug if separator == "-" else slug.replace("-", separator)
+
+
+def _create_markdown_processor() -> markdown.Markdown:
+    """Create configured markdown processor with extensions."""
+    # Imported here so loading the service layer doesn't pull in
+    # markdown and its extensions until something is rendered
+    import markdown
+    from markdown.extensions.codehilite import CodeHiliteExtension
+    from markdown.extensions.fenced_code import FencedCodeExtension
+    from markdown.extensions.tables import TableExtension
+    from markdown.extensions.toc import TocExtension
+
+    try:
+        import pymdownx  # noqa: F401 - verify package available
+
+        extensions = [
+            TableExtension(),
+            TocExtension(permalink=True, slugify=_slugify),
+            FencedCodeExtension(),
+            CodeHiliteExtension(css_class="highlight", guess_lang=True),
+            "footnotes",
+            "pymdownx.tasklist",
+            "pymdownx.superfences",
+        ]
+        extension_configs = {
+            "pymdownx.tasklist": {"custom_checkbox": True},
+            "pymdownx.superfences": {
+                "custom_fences": [
+                    {
+                        "name": "mermaid",
+                        "class": "mermaid",
+                        "format": _mermaid_format,
+                    }
+                ]
+            },
+        }
+    except ImportError:
+        # Fallback without pymdownx
+        extensions = [
+            TableExtension(),
+            TocExtension(permalink=True, slugify=_slugify),
+            FencedCodeExtension(),
+            CodeHiliteExtension(css_class="highlight", guess_lang=True),
+            "footnotes",
+        ]
+        extension_configs = {}
+
+    return markdown.Markdown(
+        extensions=extensions,
+        extension_configs=extension_configs,
+        output_format="html5",
+    )
+
+
+def _markdown_to_html(md: markdown.Markdown, content: str, include_toc: bool) -> str:
+    """Convert markdown to an HTML body, optionally prefixed with its TOC.
+
+    Args:
+        md: The markdown processor to use.
+        content: The markdown content, without frontmatter.
+        include_toc: Whether to include a table of contents.
+
+    Returns:
+        The rendered HTML content.
+    """
+    # Reset markdown processor state
+    md.reset()
+
+    # Render markdown to HTML
+    html_content = md.convert(content)
+
+    # Get TOC if available
+    toc_html = ""
+    if include_toc and hasattr(md, "toc"):
+        toc_html = f'<nav class="toc">\n<h2>Contents</h2>\n{md.toc}\n</nav>'
+
+    return f"{toc_html}\n{html_content}"
+
+
+# Markdown processor owned by a render_book worker process
+_worker_md: markdown.Markdown | None = None
+
+
+def _render_in_worker(content: str) -> str:
+    """Render a chapter body in a render_book worker process.
+
+    Args:
+        content: The markdown content, without frontmatter.
+
+    Returns:
+        The rendered HTML content, including its table of contents.
+    """
+    global _worker_md
+    if _worker_md is None:
+        _worker_md = _create_markdown_processor()
+    return _markdown_to_html(_worker_md, content, include_toc=True)
+
 
 class RenderService:
     """Service for rendering markdown to HTML.
@@ -422,6 +541,9 @@ class RenderService:
     - Mermaid diagram support
     """
 
+    # Maximum number of rendered chapter bodies kept in memory
+    HTML_CACHE_SIZE = 16
+
     def __init__(
         self,
         file_repo: IFileRepository,
@@ -435,67 +557,9 @@ class RenderService:
         """
         self._file_repo = file_repo
         self._reader_service = reader_service
-        self._md = self._create_markdown_processor()
-
-    def _create_markdown_processor(self) -> markdown.Markdown:
-        """Create configured markdown processor with extensions."""
-        try:
-            import pymdownx  # noqa: F401 - verify package available
-
-            extensions = [
-                TableExtension(),
-                TocExtension(permalink=True, slugify=self._slugify),
-                FencedCodeExtension(),
-                CodeHiliteExtension(css_class="highlight", guess_lang=True),
-                "footnotes",
-                "pymdownx.tasklist",
-                "pymdownx.superfences",
-            ]
-            extension_configs = {
-                "pymdownx.tasklist": {"custom_checkbox": True},
-                "pymdownx.superfences": {
-                    "custom_fences": [
-                        {
-                            "name": "mermaid",
-                            "class": "mermaid",
-                            "format": self._mermaid_format,
-                        }
-                    ]
-                },
-            }
-        except ImportError:
-            # Fallback without pymdownx
-            extensions = [
-                TableExtension(),
-                TocExtension(permalink=True, slugify=self._slugify),
-                FencedCodeExtension(),
-                CodeHiliteExtension(css_class="highlight", guess_lang=True),
-                "footnotes",
-            ]
-            extension_configs = {}
-
-        return markdown.Markdown(
-            extensions=extensions,
-            extension_configs=extension_configs,
-            output_format="html5",
-        )
-
-    def _mermaid_format(
-        self,
-        source: str,
-        language: str,
-        css_class: str,
-        options: dict,
-        md: markdown.Markdown,
-        **kwargs,
-    ) -> str:
-        """Custom formatter for mermaid code blocks."""
-        return f'<div class="mermaid">\n{source}\n</div>'
-
-    def _slugify(self, value: str, separator: str = "-") -> str:
-        """Convert heading text to URL-friendly slug."""
-        value = re.sub(r"[^\w\s-]", "", value.lower().strip())
-        return re.sub(r"[\s_-]+", separator, value).strip(separator)
+        self._md = _create_markdown_processor()
+        # (content, include_toc) -> rendered HTML, least recently used first
+        self._html_cache: OrderedDict[tuple[str, bool], str] = OrderedDict()
 
     def render_chapter(
         self,
@@ -518,22 +582,21 @@ class RenderService:
             # Strip frontmatter
             content = self._strip_frontmatter(content)
 
-        # Expand [TOC] markers
-        if "[TOC]" in content:
-            content = content.replace("[TOC]", "[TOC]")  # TocExtension handles this
-
-        # Reset markdown processor state
-        self._md.reset()
+        # Rendering is pure in the content, so unchanged chapters reuse HTML
+        cache_key = (content, include_toc)
+        cached = self._html_cache.get(cache_key)
+        if cached is not None:
+            self._html_cache.move_to_end(cache_key)
+            return cached
 
-        # Render markdown to HTML
-        html_content = self._md.convert(content)
+        # [TOC] markers are expanded by TocExtension
+        html = _markdown_to_html(self._md, content, include_toc)
 
-        # Get TOC if available
-        toc_html = ""
-        if include_toc and hasattr(self._md, "toc"):
-            toc_html = f'<nav class="toc">\n<h2>Contents</h2>\n{self._md.toc}\n</nav>'
+        self._html_cache[cache_key] = html
+        if len(self._html_cache) > self.HTML_CACHE_SIZE:
+            self._html_cache.popitem(last=False)
 
-        return f"{toc_html}\n{html_content}"
+        return html
 
     def render_chapter_full(
         self,
@@ -541,6 +604,7 @@ class RenderService:
         book: Book,
         content: Optional[str] = None,
         include_nav: bool = True,
+        chapter_index: Optional[int] = None,
     ) -> str:
         """Render a chapter as a complete HTML document.
 
@@ -549,22 +613,41 @@ class RenderService:
             book: The book containing the chapter.
             content: Optional pre-loaded content.
             include_nav: Whether to include navigation links.
+            chapter_index: Optional position of the chapter in
+                book.chapters, to skip looking it up.
 
         Returns:
             Complete HTML document string.
         """
-        html_content = self.render_chapter(chapter, content)
+        # Read the chapter once for both mermaid detection and rendering
+        if content is None:
+            raw_content = self._reader_service.get_chapter_content(chapter)
+            has_mermaid = self._has_mermaid(raw_content)
+            content = self._strip_frontmatter(raw_content)
+        else:
+            has_mermaid = self._has_mermaid(content)
 
-        # Check for mermaid content
-        has_mermaid = self._has_mermaid(
-            content or self._reader_service.get_chapter_content(chapter)
+        html_content = self.render_chapter(chapter, content)
+        return self._build_page(
+            chapter, book, html_content, has_mermaid, include_nav, chapter_index
         )
-        scripts = MERMAID_SCRIPT.format(mermaid_cdn=MERMAID_CDN) if has_mermaid else ""
+
+    def _build_page(
+        self,
+        chapter: Chapter,
+        book: Book,
+        html_content: str,
+        has_mermaid: bool,
+        include_nav: bool = True,
+        chapter_index: Optional[int] = None,
+    ) -> str:
+        """Wrap a rendered chapter body in the full HTML document."""
+        scripts = MERMAID_SCRIPT_HTML if has_mermaid else ""
 
         # Build navigation with theme switcher
         nav = ""
         if include_nav:
-            nav = self._build_nav(chapter, book)
+            nav = self._build_nav(chapter, book, chapter_index)
 
         return HTML_TEMPLATE.format(
             lang=book.metadata.language,
@@ -582,12 +665,16 @@ class RenderService:
         self,
         book: Book,
         output_dir: Path,
+        jobs: int = 1,
     ) -> list[Path]:
         """Render all chapters of a book to HTML files.
 
         Args:
             book: The book to render.
             output_dir: Directory to write HTML files to.
+            jobs: Number of worker processes for converting markdown.
+                With more than one, chapters are converted in parallel
+                and each page is written as soon as its chapter is done.
 
         Returns:
             List of paths to generated HTML files.
@@ -596,9 +683,17 @@ class RenderService:
 
         generated_files: list[Path] = []
 
-        for chapter in book.chapters:
-            html = self.render_chapter_full(chapter, book)
+        if jobs > 1 and len(book.chapters) > 1:
+            pages = self._render_pages_parallel(book, jobs)
+        else:
+            pages = (
+                self.render_chapter_full(chapter, book, chapter_index=idx)
+                for idx, chapter in enumerate(book.chapters)
+            )
 
+        # Pages come first so the generator runs to completion (shutting
+        # down any worker pool) before the loop ends
+        for html, chapter in zip(pages, book.chapters):
             # Generate output filename
             if chapter.is_intro:
                 filename = "index.html"
@@ -618,16 +713,52 @@ class RenderService:
 
         return generated_files
 
-    def _build_nav(self, chapter: Chapter, book: Book) -> str:
+    def _render_pages_parallel(self, book: Book, jobs: int) -> Iterator[str]:
+        """Render chapter pages, converting markdown in worker processes.
+
+        Chapter files are read here and only the markdown conversion, which
+        is CPU bound, is sent to the workers.
+
+        Args:
+            book: The book to render.
+            jobs: Maximum number of worker processes.
+
+        Yields:
+            Complete HTML documents in chapter order.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        bodies: list[str] = []
+        mermaid_flags: list[bool] = []
+        for chapter in book.chapters:
+            raw_content = self._reader_service.get_chapter_content(chapter)
+            mermaid_flags.append(self._has_mermaid(raw_content))
+            bodies.append(self._strip_frontmatter(raw_content))
+
+        workers = min(jobs, len(book.chapters))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            html_bodies = executor.map(_render_in_worker, bodies)
+            for idx, html_content in enumerate(html_bodies):
+                yield self._build_page(
+                    book.chapters[idx],
+                    book,
+                    html_content,
+                    mermaid_flags[idx],
+                    chapter_index=idx,
+                )
+
+    def _build_nav(
+        self, chapter: Chapter, book: Book, chapter_idx: Optional[int] = None
+    ) -> str:
         """Build navigation HTML for a chapter with theme switcher."""
         nav_items = []
 
-        # Find chapter index
-        chapter_idx = None
-        for idx, ch in enumerate(book.chapters):
-            if ch.file_path == chapter.file_path:
-                chapter_idx = idx
-                break
+        # Find chapter index unless the caller already knows it
+        if chapter_idx is None:
+            for idx, ch in enumerate(book.chapters):
+                if ch.file_path == chapter.file_path:
+                    chapter_idx = idx
+                    break
 
         if chapter_idx is None:
             return THEME_SWITCHER_HTML
@@ -676,16 +807,13 @@ class RenderService:
             content += f"<p>{book.metadata.description}</p>\n"
         content += "\n<h2>Chapters</h2>\n" + "\n".join(chapters_html)
 
-        # Build nav with just the theme switcher
-        nav = f'<nav class="page-nav">{THEME_SWITCHER_HTML}</nav>'
-
         return HTML_TEMPLATE.format(
             lang=book.metadata.language,
             title=book.metadata.title,
             theme_init=THEME_INIT_SCRIPT,
             theme_css=THEME_CSS,
             extra_head="",
-            nav=nav,
+            nav=THEME_ONLY_NAV_HTML,
             content=content,
             scripts="",
             theme_js=THEME_SWITCHER_JS,
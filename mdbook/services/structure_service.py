@@ -8,14 +8,21 @@ Provides book structure detection and parsing for various formats:
 - Auto-detection via filename patterns
 """
 
+import os
 import re
+import threading
+from collections import OrderedDict
 from datetime import date
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from ..domain import Chapter, ChapterMetadata, FormatType
 from ..repositories.interfaces import IConfigRepository, IFileRepository
 
+# A discovered chapter file: (file_path, default_title, is_intro)
+_ChapterEntry = tuple[Path, str | None, bool]
+
 
 class StructureService:
     """Detects and parses book structure from various formats.
@@ -55,14 +62,23 @@ class StructureService:
         r"(\d+)[-_]",
     )
 
-    # Priority patterns for selecting best content file
-    PRIORITY_PATTERNS = (
-        r".*complete\.md$",
-        r".*enhanced\.md$",
-        r".*revised\.md$",
-        r".*final\.md$",
+    # Priority suffixes for selecting best content file (matched case-insensitively)
+    PRIORITY_SUFFIXES = (
+        "complete.md",
+        "enhanced.md",
+        "revised.md",
+        "final.md",
     )
 
+    # Lines read from each chapter when extracting frontmatter and title
+    METADATA_HEAD_LINES = 200
+
+    # Upper bound on threads used to read chapter metadata
+    METADATA_WORKERS = 8
+
+    # Maximum number of chapter files whose parsed metadata is cached
+    METADATA_CACHE_SIZE = 256
+
     def __init__(
         self,
         file_repo: IFileRepository,
@@ -76,6 +92,11 @@ class StructureService:
         """
         self._file_repo = file_repo
         self._config_repo = config_repo
+        # path -> (st_mtime_ns, st_size, metadata or None if unparseable)
+        self._metadata_cache: OrderedDict[
+            Path, tuple[int, int, ChapterMetadata | None]
+        ] = OrderedDict()
+        self._metadata_lock = threading.Lock()
 
     def detect_format(self, root: Path) -> FormatType:
         """Detect the book format type from directory structure.
@@ -127,7 +148,9 @@ class StructureService:
 
         return FormatType.AUTO
 
-    def parse_structure(self, root: Path, format_type: FormatType) -> list[Chapter]:
+    def parse_structure(
+        self, root: Path, format_type: FormatType, lazy: bool = False
+    ) -> list[Chapter]:
         """Parse the book structure and return ordered chapters.
 
         Reads the table of contents or directory structure to build
@@ -136,6 +159,8 @@ class StructureService:
         Args:
             root: Root directory of the book project.
             format_type: The book format type to use for parsing.
+            lazy: If True, defer reading each chapter's frontmatter and
+                title until its metadata is first accessed.
 
         Returns:
             A list of Chapter objects in reading order.
@@ -145,15 +170,17 @@ class StructureService:
             ValueError: If the structure cannot be parsed.
         """
         if format_type == FormatType.MDBOOK:
-            return self._parse_mdbook(root)
+            entries = self._parse_mdbook(root)
         elif format_type == FormatType.GITBOOK:
-            return self._parse_summary_md(root, root / "SUMMARY.md")
+            entries = self._parse_summary_md(root, root / "SUMMARY.md")
         elif format_type == FormatType.LEANPUB:
-            return self._parse_leanpub(root)
+            entries = self._parse_leanpub(root)
         elif format_type == FormatType.BOOKDOWN:
-            return self._parse_bookdown(root)
+            entries = self._parse_bookdown(root)
         else:
-            return self._auto_detect(root)
+            entries = self._auto_detect(root)
+
+        return self._build_chapters(entries, lazy=lazy)
 
     def parse_frontmatter(self, content: str) -> ChapterMetadata:
         """Parse YAML frontmatter from chapter content.
@@ -270,20 +297,26 @@ class StructureService:
                 content = content[3 + end_match.end() :]
 
         for line in content.split("\n"):
-            line = line.strip()
+            # Headings normally start at column 0; only strip indented lines
             if line.startswith("# "):
-                return line[2:].strip()
+                title = line[2:].strip()
+                if title:
+                    return title
+            elif line[:1].isspace():
+                line = line.strip()
+                if line.startswith("# "):
+                    return line[2:].strip()
 
         return None
 
-    def _parse_mdbook(self, root: Path) -> list[Chapter]:
+    def _parse_mdbook(self, root: Path) -> list[_ChapterEntry]:
         """Parse mdBook format structure.
 
         Args:
             root: Root directory of the book project.
 
         Returns:
-            List of chapters in reading order.
+            Chapter entries in reading order.
         """
         # mdBook uses src/SUMMARY.md by default
         src_summary = root / "src" / "SUMMARY.md"
@@ -298,7 +331,9 @@ class StructureService:
         # Fall back to auto-detection
         return self._auto_detect(root)
 
-    def _parse_summary_md(self, root: Path, summary_path: Path) -> list[Chapter]:
+    def _parse_summary_md(
+        self, root: Path, summary_path: Path
+    ) -> list[_ChapterEntry]:
         """Parse SUMMARY.md format (mdBook/GitBook).
 
         Args:
@@ -306,15 +341,14 @@ class StructureService:
             summary_path: Path to the SUMMARY.md file.
 
         Returns:
-            List of chapters in reading order.
+            Chapter entries in reading order.
         """
         try:
             content = self._file_repo.read_file(summary_path)
         except FileNotFoundError:
             return self._auto_detect(root)
 
-        chapters = []
-        chapter_num = 0
+        entries: list[_ChapterEntry] = []
 
         # Parse markdown links: [Title](path/to/file.md)
         link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+\.md)\)")
@@ -337,52 +371,18 @@ class StructureService:
                         "index.md",
                         "introduction.md",
                     }
+                    entries.append((file_path, title, is_intro))
+
+        return entries
 
-                    # Enrich with frontmatter
-                    metadata = self._get_chapter_metadata(file_path, title)
-
-                    if is_intro:
-                        metadata = ChapterMetadata(
-                            title=metadata.title,
-                            number=0,
-                            author=metadata.author,
-                            date=metadata.date,
-                            draft=metadata.draft,
-                            extra=metadata.extra,
-                        )
-                        chapter = Chapter(
-                            file_path=file_path,
-                            metadata=metadata,
-                            is_intro=True,
-                        )
-                    else:
-                        chapter_num += 1
-                        metadata = ChapterMetadata(
-                            title=metadata.title,
-                            number=chapter_num,
-                            author=metadata.author,
-                            date=metadata.date,
-                            draft=metadata.draft,
-                            extra=metadata.extra,
-                        )
-                        chapter = Chapter(
-                            file_path=file_path,
-                            metadata=metadata,
-                            is_intro=False,
-                        )
-
-                    chapters.append(chapter)
-
-        return chapters
-
-    def _parse_leanpub(self, root: Path) -> list[Chapter]:
+    def _parse_leanpub(self, root: Path) -> list[_ChapterEntry]:
         """Parse Book.txt format (Leanpub).
 
         Args:
             root: Root directory of the book project.
 
         Returns:
-            List of chapters in reading order.
+            Chapter entries in reading order.
         """
         book_txt_path = root / "Book.txt"
 
@@ -391,8 +391,7 @@ class StructureService:
         except FileNotFoundError:
             return self._auto_detect(root)
 
-        chapters = []
-        chapter_num = 0
+        entries: list[_ChapterEntry] = []
 
         # Leanpub Book.txt is a simple list of file paths
         manuscript_dir = root / "manuscript"
@@ -417,52 +416,18 @@ class StructureService:
                     "preface.md",
                     "foreword.md",
                 }
+                entries.append((file_path, None, is_intro))
 
-                # Get metadata from file
-                metadata = self._get_chapter_metadata(file_path)
-
-                if is_intro:
-                    metadata = ChapterMetadata(
-                        title=metadata.title,
-                        number=0,
-                        author=metadata.author,
-                        date=metadata.date,
-                        draft=metadata.draft,
-                        extra=metadata.extra,
-                    )
-                    chapter = Chapter(
-                        file_path=file_path,
-                        metadata=metadata,
-                        is_intro=True,
-                    )
-                else:
-                    chapter_num += 1
-                    metadata = ChapterMetadata(
-                        title=metadata.title,
-                        number=chapter_num,
-                        author=metadata.author,
-                        date=metadata.date,
-                        draft=metadata.draft,
-                        extra=metadata.extra,
-                    )
-                    chapter = Chapter(
-                        file_path=file_path,
-                        metadata=metadata,
-                        is_intro=False,
-                    )
-
-                chapters.append(chapter)
-
-        return chapters
-
-    def _parse_bookdown(self, root: Path) -> list[Chapter]:
+        return entries
+
+    def _parse_bookdown(self, root: Path) -> list[_ChapterEntry]:
         """Parse _bookdown.yml format.
 
         Args:
             root: Root directory of the book project.
 
         Returns:
-            List of chapters in reading order.
+            Chapter entries in reading order.
         """
         bookdown_path = root / "_bookdown.yml"
 
@@ -471,8 +436,8 @@ class StructureService:
         except FileNotFoundError:
             return self._auto_detect(root)
 
-        chapters = []
-        chapter_num = 0
+        entries: list[_ChapterEntry] = []
+        has_numbered = False
 
         # Get chapter files from rmd_files or chapter_name pattern
         rmd_files = config.get("rmd_files", [])
@@ -488,46 +453,14 @@ class StructureService:
                 else:
                     continue
 
-            is_intro = "index" in file_name.lower() or idx == 0
+            # Intro files only count before the first numbered chapter
+            is_intro = ("index" in file_name.lower() or idx == 0) and not has_numbered
+            has_numbered = has_numbered or not is_intro
+            entries.append((file_path, None, is_intro))
 
-            # Get metadata from file
-            metadata = self._get_chapter_metadata(file_path)
+        return entries
 
-            if is_intro and chapter_num == 0:
-                metadata = ChapterMetadata(
-                    title=metadata.title,
-                    number=0,
-                    author=metadata.author,
-                    date=metadata.date,
-                    draft=metadata.draft,
-                    extra=metadata.extra,
-                )
-                chapter = Chapter(
-                    file_path=file_path,
-                    metadata=metadata,
-                    is_intro=True,
-                )
-            else:
-                chapter_num += 1
-                metadata = ChapterMetadata(
-                    title=metadata.title,
-                    number=chapter_num,
-                    author=metadata.author,
-                    date=metadata.date,
-                    draft=metadata.draft,
-                    extra=metadata.extra,
-                )
-                chapter = Chapter(
-                    file_path=file_path,
-                    metadata=metadata,
-                    is_intro=False,
-                )
-
-            chapters.append(chapter)
-
-        return chapters
-
-    def _auto_detect(self, root: Path) -> list[Chapter]:
+    def _auto_detect(self, root: Path) -> list[_ChapterEntry]:
         """Auto-detect chapters from file patterns.
 
         - Sort .md files alphanumerically
@@ -538,30 +471,17 @@ class StructureService:
             root: Root directory of the book project.
 
         Returns:
-            List of chapters in reading order.
+            Chapter entries in reading order.
         """
-        chapters = []
-        chapter_num = 0
+        entries: list[_ChapterEntry] = []
+        intro_path: Path | None = None
 
         # First, check for intro files
         for intro_file in self.INTRO_FILES:
-            intro_path = root / intro_file
-            if self._file_repo.exists(intro_path):
-                metadata = self._get_chapter_metadata(intro_path, "Introduction")
-                metadata = ChapterMetadata(
-                    title=metadata.title,
-                    number=0,
-                    author=metadata.author,
-                    date=metadata.date,
-                    draft=metadata.draft,
-                    extra=metadata.extra,
-                )
-                chapter = Chapter(
-                    file_path=intro_path,
-                    metadata=metadata,
-                    is_intro=True,
-                )
-                chapters.append(chapter)
+            candidate = root / intro_file
+            if self._file_repo.exists(candidate):
+                intro_path = candidate
+                entries.append((candidate, "Introduction", True))
                 break
 
         # Collect all markdown files
@@ -572,31 +492,132 @@ class StructureService:
 
         for file_path in md_files:
             # Skip files we've already added as intro
-            if any(c.file_path == file_path for c in chapters):
+            if file_path == intro_path:
                 continue
 
             # Skip files in skip list
             if file_path.name in self.SKIP_FILES:
                 continue
 
-            metadata = self._get_chapter_metadata(file_path)
-            chapter_num += 1
-            metadata = ChapterMetadata(
-                title=metadata.title,
-                number=chapter_num,
-                author=metadata.author,
-                date=metadata.date,
-                draft=metadata.draft,
-                extra=metadata.extra,
-            )
-            chapter = Chapter(
+            entries.append((file_path, None, False))
+
+        return entries
+
+    def _build_chapters(
+        self, entries: list[_ChapterEntry], lazy: bool = False
+    ) -> list[Chapter]:
+        """Build numbered chapters from discovered chapter files.
+
+        Intro chapters are numbered 0; other chapters are numbered from 1
+        in reading order.
+
+        Args:
+            entries: Chapter entries in reading order.
+            lazy: If True, return deferred chapters that read their
+                metadata on first access.
+
+        Returns:
+            List of chapters in reading order.
+        """
+        numbers = []
+        chapter_num = 0
+        for _, _, is_intro in entries:
+            if is_intro:
+                numbers.append(0)
+            else:
+                chapter_num += 1
+                numbers.append(chapter_num)
+
+        if lazy:
+            return [
+                Chapter.deferred(
+                    file_path=file_path,
+                    number=number,
+                    loader=partial(
+                        self._numbered_metadata, file_path, default_title, number
+                    ),
+                    is_intro=is_intro,
+                )
+                for (file_path, default_title, is_intro), number in zip(
+                    entries, numbers
+                )
+            ]
+
+        metadata_list = self._load_chapter_metadata(
+            [(file_path, default_title) for file_path, default_title, _ in entries]
+        )
+
+        return [
+            Chapter(
                 file_path=file_path,
-                metadata=metadata,
-                is_intro=False,
+                metadata=self._with_number(metadata, number),
+                is_intro=is_intro,
             )
-            chapters.append(chapter)
+            for (file_path, _, is_intro), metadata, number in zip(
+                entries, metadata_list, numbers
+            )
+        ]
+
+    def _numbered_metadata(
+        self, file_path: Path, default_title: str | None, number: int
+    ) -> ChapterMetadata:
+        """Load chapter metadata and assign its reading-order number.
+
+        Args:
+            file_path: Path to the chapter file.
+            default_title: Default title if none found.
+            number: The chapter number to assign.
+
+        Returns:
+            ChapterMetadata with the given number.
+        """
+        metadata = self._get_chapter_metadata(file_path, default_title)
+        return self._with_number(metadata, number)
+
+    def _with_number(self, metadata: ChapterMetadata, number: int) -> ChapterMetadata:
+        """Copy chapter metadata with a different chapter number.
+
+        Args:
+            metadata: The source metadata.
+            number: The chapter number to assign.
 
-        return chapters
+        Returns:
+            A new ChapterMetadata instance.
+        """
+        return ChapterMetadata(
+            title=metadata.title,
+            number=number,
+            author=metadata.author,
+            date=metadata.date,
+            draft=metadata.draft,
+            # Cached metadata is shared, so each chapter gets its own extras
+            extra=dict(metadata.extra),
+        )
+
+    def _load_chapter_metadata(
+        self, items: list[tuple[Path, str | None]]
+    ) -> list[ChapterMetadata]:
+        """Load metadata for several chapter files concurrently.
+
+        Reading chapter heads is I/O bound and independent per file, so
+        the reads are fanned out over a small thread pool.
+
+        Args:
+            items: (file_path, default_title) tuples.
+
+        Returns:
+            ChapterMetadata for each item, in the same order.
+        """
+        if len(items) < 2:
+            return [self._get_chapter_metadata(path, title) for path, title in items]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(self.METADATA_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda item: self._get_chapter_metadata(*item), items)
+            )
 
     def _collect_markdown_files(self, root: Path) -> list[Path]:
         """Collect markdown files, respecting skip patterns.
@@ -609,42 +630,45 @@ class StructureService:
         """
         md_files = []
 
-        # Check for chapter directories (chapter-01, etc.)
-        chapter_dirs = sorted(
-            [d for d in self._file_repo.list_files(root, "chapter-*") if d.is_dir()],
-            key=lambda p: p.name,
-        )
-
-        # Try glob pattern for directories
+        # Check for chapter directories (chapter-01, etc.) in a single
+        # pass over the root, using each entry's cached file type
         try:
-            chapter_dirs = sorted(root.glob("chapter-*"))
-            chapter_dirs = [d for d in chapter_dirs if d.is_dir()]
-        except Exception:
-            chapter_dirs = []
+            with os.scandir(root) as it:
+                dir_names = [
+                    entry.name
+                    for entry in it
+                    if entry.name.startswith("chapter-") and entry.is_dir()
+                ]
+        except OSError:
+            dir_names = []
+        chapter_dirs = [root / name for name in sorted(dir_names)]
 
         if chapter_dirs:
             for chapter_dir in chapter_dirs:
-                # Look in content subdirectory first
+                # Look in content subdirectory first; only the chosen file
+                # is turned into a Path
                 content_dir = chapter_dir / "content"
-                if content_dir.is_dir():
-                    content_files = self._file_repo.list_files(content_dir, "*.md")
-                    if content_files:
-                        # Pick best file from content directory
-                        best_file = self._pick_best_content_file(content_files)
-                        if best_file:
-                            md_files.append(best_file)
-                        continue
+                try:
+                    content_names = self._file_repo.list_names(content_dir, "*.md")
+                except NotADirectoryError:
+                    content_names = []
+                if content_names:
+                    # Pick best file from content directory
+                    best_name = self._pick_best_content_file(content_names)
+                    if best_name:
+                        md_files.append(content_dir / best_name)
+                    continue
 
                 # Otherwise look for .md files directly in chapter dir
-                direct_files = [
-                    f
-                    for f in self._file_repo.list_files(chapter_dir, "*.md")
-                    if not f.name.startswith("_")
+                direct_names = [
+                    name
+                    for name in self._file_repo.list_names(chapter_dir, "*.md")
+                    if not name.startswith("_")
                 ]
-                if direct_files:
-                    best_file = self._pick_best_content_file(direct_files)
-                    if best_file:
-                        md_files.append(best_file)
+                if direct_names:
+                    best_name = self._pick_best_content_file(direct_names)
+                    if best_name:
+                        md_files.append(chapter_dir / best_name)
 
             return md_files
 
@@ -670,25 +694,26 @@ class StructureService:
 
         return md_files
 
-    def _pick_best_content_file(self, files: list[Path]) -> Path | None:
-        """Pick the best content file from a list based on priority patterns.
+    def _pick_best_content_file(self, names: list[str]) -> str | None:
+        """Pick the best content file from a list based on priority suffixes.
 
         Args:
-            files: List of candidate files.
+            names: List of candidate file names.
 
         Returns:
-            The best file, or None if list is empty.
+            The best file name, or None if list is empty.
         """
-        if not files:
+        if not names:
             return None
 
-        for pattern in self.PRIORITY_PATTERNS:
-            for f in files:
-                if re.match(pattern, f.name, re.IGNORECASE):
-                    return f
+        lowered = [(name, name.lower()) for name in names]
+        for suffix in self.PRIORITY_SUFFIXES:
+            for name, lower in lowered:
+                if lower.endswith(suffix):
+                    return name
 
         # Return first file if no priority match
-        return files[0]
+        return names[0]
 
     def _extract_sort_key(self, file_path: Path) -> tuple[int, str]:
         """Extract a sort key from filename for proper ordering.
@@ -727,37 +752,107 @@ class StructureService:
         Returns:
             ChapterMetadata populated from file content.
         """
-        try:
-            content = self._file_repo.read_file(file_path)
-            metadata = self.parse_frontmatter(content)
-
-            # Use default title if metadata title is "Untitled"
-            if metadata.title == "Untitled" and default_title:
-                metadata = ChapterMetadata(
-                    title=default_title,
-                    number=metadata.number,
-                    author=metadata.author,
-                    date=metadata.date,
-                    draft=metadata.draft,
-                    extra=metadata.extra,
-                )
-            elif metadata.title == "Untitled":
-                # Generate title from filename
-                title = self._title_from_filename(file_path.stem)
-                metadata = ChapterMetadata(
-                    title=title,
-                    number=metadata.number,
-                    author=metadata.author,
-                    date=metadata.date,
-                    draft=metadata.draft,
-                    extra=metadata.extra,
-                )
+        metadata = self._parse_chapter_file(file_path)
 
-            return metadata
-        except Exception:
+        if metadata is None:
             title = default_title or self._title_from_filename(file_path.stem)
             return ChapterMetadata(title=title)
 
+        # Use default title if metadata title is "Untitled"
+        if metadata.title == "Untitled" and default_title:
+            metadata = ChapterMetadata(
+                title=default_title,
+                number=metadata.number,
+                author=metadata.author,
+                date=metadata.date,
+                draft=metadata.draft,
+                extra=metadata.extra,
+            )
+        elif metadata.title == "Untitled":
+            # Generate title from filename
+            title = self._title_from_filename(file_path.stem)
+            metadata = ChapterMetadata(
+                title=title,
+                number=metadata.number,
+                author=metadata.author,
+                date=metadata.date,
+                draft=metadata.draft,
+                extra=metadata.extra,
+            )
+
+        return metadata
+
+    def _parse_chapter_file(self, file_path: Path) -> ChapterMetadata | None:
+        """Parse frontmatter metadata from a chapter file, with caching.
+
+        Results are cached per file while its mtime and size are unchanged.
+        Parse failures are cached too, so a chapter with malformed
+        frontmatter isn't re-read and re-parsed on every structure load.
+        Read errors are not, since permission changes don't touch the mtime.
+
+        Args:
+            file_path: Path to the chapter file.
+
+        Returns:
+            The parsed ChapterMetadata, or None if the file could not be
+            read or parsed.
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            # Not statable on the local file system; parse without caching
+            st = None
+
+        if st is not None:
+            with self._metadata_lock:
+                cached = self._metadata_cache.get(file_path)
+                if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                    self._metadata_cache.move_to_end(file_path)
+                    return cached[2]
+
+        try:
+            # Frontmatter and the first heading are near the top, so avoid
+            # reading whole chapters unless the head turns out too short
+            head = self._file_repo.read_head(file_path, self.METADATA_HEAD_LINES)
+            metadata = self.parse_frontmatter(head)
+            if head.count("\n") >= self.METADATA_HEAD_LINES and (
+                self._head_is_incomplete(head, metadata)
+            ):
+                content = self._file_repo.read_file(file_path)
+                metadata = self.parse_frontmatter(content)
+        except OSError:
+            # May be transient; try again on the next load
+            return None
+        except Exception:
+            metadata = None
+
+        if st is not None:
+            with self._metadata_lock:
+                self._metadata_cache[file_path] = (
+                    st.st_mtime_ns,
+                    st.st_size,
+                    metadata,
+                )
+                self._metadata_cache.move_to_end(file_path)
+                if len(self._metadata_cache) > self.METADATA_CACHE_SIZE:
+                    self._metadata_cache.popitem(last=False)
+
+        return metadata
+
+    def _head_is_incomplete(self, head: str, metadata: ChapterMetadata) -> bool:
+        """Check whether a truncated file head may hide chapter metadata.
+
+        Args:
+            head: The leading lines of a chapter file.
+            metadata: Metadata parsed from those lines.
+
+        Returns:
+            True if the frontmatter is unclosed or no title was found.
+        """
+        if head.startswith("---") and not re.search(r"\n---\s*\n", head[3:]):
+            return True
+        return metadata.title == "Untitled"
+
     def _title_from_filename(self, stem: str) -> str:
         """Convert filename stem to title.
 
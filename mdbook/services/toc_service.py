@@ -7,7 +7,7 @@ chapters and books, supporting multiple heading levels.
 import re
 
 from ..domain import Book, Chapter
-from ..domain.content import TocEntry, ChapterToc, BookToc
+from ..domain.content import TocEntry, ChapterToc, BookToc, slugify
 from .interfaces import IReaderService
 
 
@@ -198,10 +198,7 @@ class TocService:
         Returns:
             URL-friendly anchor string.
         """
-        text = text.lower().strip()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[\s_-]+", "-", text)
-        return text.strip("-")
+        return slugify(text)
 
     def _strip_frontmatter(self, content: str) -> str:
         """Strip YAML frontmatter from content.
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from .reader_service import ReaderService
 
 from ..domain import Book, BookMetadata, Chapter, ChapterMetadata
+from ..domain.content import slugify
 from ..repositories.interfaces import IConfigRepository, IFileRepository
 from .interfaces import IStructureService
 
@@ -46,21 +47,6 @@ class EditResult:
         return result
 
 
-def _slugify(text: str) -> str:
-    """Convert text to URL-friendly slug.
-
-    Args:
-        text: The text to convert.
-
-    Returns:
-        A lowercase, hyphen-separated slug.
-    """
-    text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "-", text)
-    return text.strip("-")
-
-
 class WriterService:
     """Service for writing and modifying books.
 
@@ -173,7 +159,7 @@ class WriterService:
         chapter_num = self._get_next_chapter_number(chapters_dir)
 
         # Create filename from title
-        slug = _slugify(title)
+        slug = slugify(title)
         filename = f"{chapter_num:02d}-{slug}.md"
         chapter_path = chapters_dir / filename
 
@@ -410,7 +396,7 @@ class WriterService:
             FileNotFoundError: If the book or chapter doesn't exist.
             KeyError: If the chapter or section is not found.
         """
-        book = reader_service.load_book(book_path)
+        book = reader_service.load_book(book_path, lazy=True)
         chapter = book.get_chapter(chapter_index)
 
         if chapter is None:
@@ -504,7 +490,7 @@ class WriterService:
             FileNotFoundError: If the book or chapter doesn't exist.
             KeyError: If the chapter or section is not found.
         """
-        book = reader_service.load_book(book_path)
+        book = reader_service.load_book(book_path, lazy=True)
         chapter = book.get_chapter(chapter_index)
 
         if chapter is None:
@@ -658,7 +644,7 @@ class WriterService:
             FileNotFoundError: If the book or chapter doesn't exist.
             KeyError: If the chapter is not found.
         """
-        book = reader_service.load_book(book_path)
+        book = reader_service.load_book(book_path, lazy=True)
         chapter = book.get_chapter(chapter_index)
 
         if chapter is None:
@@ -739,7 +725,7 @@ class WriterService:
             FileNotFoundError: If the book or chapter doesn't exist.
             KeyError: If the chapter is not found.
         """
-        book = reader_service.load_book(book_path)
+        book = reader_service.load_book(book_path, lazy=True)
         chapter = book.get_chapter(chapter_index)
 
         if chapter is None:
@@ -822,7 +808,7 @@ class WriterService:
             FileNotFoundError: If the book or chapter doesn't exist.
             KeyError: If the chapter or section is not found.
         """
-        book = reader_service.load_book(book_path)
+        book = reader_service.load_book(book_path, lazy=True)
         chapter = book.get_chapter(chapter_index)
 
         if chapter is None:
@@ -932,7 +918,7 @@ class WriterService:
             FileNotFoundError: If the book or chapter doesn't exist.
             KeyError: If the chapter or section is not found.
         """
-        book = reader_service.load_book(book_path)
+        book = reader_service.load_book(book_path, lazy=True)
         chapter = book.get_chapter(chapter_index)
 
         if chapter is None:
@@ -0,0 +1,158 @@
+"""Tests for the on-disk book info cache.
+
+Tests cache hits, invalidation on file changes, and opting out.
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+from unittest.mock import Mock
+
+from mdbook.domain import Book, BookMetadata, Chapter, ChapterMetadata
+from mdbook.infrastructure.book_cache import (
+    CACHE_DIR_NAME,
+    CACHE_FILE_NAME,
+    NO_CACHE_ENV,
+    load_book_info,
+)
+
+
+@pytest.fixture
+def book_root(tmp_path) -> Path:
+    """Create a minimal GitBook-style book on disk."""
+    (tmp_path / "SUMMARY.md").write_text("# Summary\n\n- [One](01.md)\n")
+    (tmp_path / "01.md").write_text("# One\n")
+    return tmp_path.resolve()
+
+
+def _book(root: Path, extra: dict | None = None) -> Book:
+    """Build the Book the service would return for book_root."""
+    return Book(
+        root_path=root,
+        metadata=BookMetadata(title="Test", created=date(2024, 1, 2)),
+        chapters=[
+            Chapter(
+                file_path=root / "01.md",
+                metadata=ChapterMetadata(
+                    title="One", number=1, date=date(2024, 1, 3), extra=extra or {}
+                ),
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def book_service(book_root):
+    """Create a mock book service returning a fresh book each call."""
+    service = Mock()
+    service.get_book_info.side_effect = lambda root: _book(book_root)
+    return service
+
+
+class TestLoadBookInfo:
+    """Tests for load_book_info."""
+
+    def test_second_load_hits_cache(self, book_service, book_root):
+        """Test that an unchanged book is loaded from the cache."""
+        first = load_book_info(book_service, book_root)
+        second = load_book_info(book_service, book_root)
+
+        assert book_service.get_book_info.call_count == 1
+        assert second == first
+        assert (book_root / CACHE_DIR_NAME / CACHE_FILE_NAME).exists()
+
+    def test_symlinked_root_is_kept(self, book_root, tmp_path_factory):
+        """Test that a book loaded through a symlink keeps the link's paths."""
+        link = tmp_path_factory.mktemp("links") / "book"
+        link.symlink_to(book_root)
+        service = Mock()
+        service.get_book_info.side_effect = lambda root: _book(root)
+
+        first = load_book_info(service, link)
+        second = load_book_info(service, link)
+
+        assert service.get_book_info.call_count == 1
+        assert first.root_path == second.root_path == link
+        assert second.chapters[0].file_path == link / "01.md"
+
+    def test_chapter_change_invalidates(self, book_service, book_root):
+        """Test that editing a chapter file forces a reload."""
+        load_book_info(book_service, book_root)
+        (book_root / "01.md").write_text("# One, revised\n")
+
+        load_book_info(book_service, book_root)
+
+        assert book_service.get_book_info.call_count == 2
+
+    def test_new_structure_file_invalidates(self, book_service, book_root):
+        """Test that adding a config file forces a reload."""
+        load_book_info(book_service, book_root)
+        (book_root / "book.toml").write_text('[book]\ntitle = "Test"\n')
+
+        load_book_info(book_service, book_root)
+
+        assert book_service.get_book_info.call_count == 2
+
+    def test_missing_listed_chapter_invalidates(self, book_service, book_root):
+        """Test that creating a listed but missing chapter forces a reload."""
+        (book_root / "appendix").mkdir()
+        (book_root / "SUMMARY.md").write_text(
+            "# Summary\n\n- [One](01.md)\n- [Appendix](appendix/a.md)\n"
+        )
+        load_book_info(book_service, book_root)
+        (book_root / "appendix" / "a.md").write_text("# Appendix\n")
+
+        load_book_info(book_service, book_root)
+
+        assert book_service.get_book_info.call_count == 2
+
+    def test_new_chapter_dir_file_invalidates(self, book_service, book_root):
+        """Test that a file added to an empty chapter directory forces a reload."""
+        (book_root / "chapter-02" / "content").mkdir(parents=True)
+        load_book_info(book_service, book_root)
+        (book_root / "chapter-02" / "content" / "two.md").write_text("# Two\n")
+
+        load_book_info(book_service, book_root)
+
+        assert book_service.get_book_info.call_count == 2
+
+    def test_use_cache_false_bypasses_cache(self, book_service, book_root):
+        """Test that use_cache=False neither reads nor writes the cache."""
+        load_book_info(book_service, book_root, use_cache=False)
+        load_book_info(book_service, book_root, use_cache=False)
+
+        assert book_service.get_book_info.call_count == 2
+        assert not (book_root / CACHE_DIR_NAME).exists()
+
+    def test_env_var_disables_cache(self, book_service, book_root, monkeypatch):
+        """Test that MDBOOK_NO_CACHE disables the cache."""
+        monkeypatch.setenv(NO_CACHE_ENV, "1")
+
+        load_book_info(book_service, book_root)
+
+        assert not (book_root / CACHE_DIR_NAME).exists()
+
+    def test_unserializable_extra_is_not_cached(self, book_root):
+        """Test that frontmatter JSON can't hold is never cached."""
+        service = Mock()
+        service.get_book_info.side_effect = lambda root: _book(
+            book_root, extra={"tags": {1, 2}}
+        )
+
+        load_book_info(service, book_root)
+        load_book_info(service, book_root)
+
+        assert service.get_book_info.call_count == 2
+
+    def test_corrupt_cache_is_rebuilt(self, book_service, book_root):
+        """Test that an unreadable cache file is replaced."""
+        cache_dir = book_root / CACHE_DIR_NAME
+        cache_dir.mkdir()
+        (cache_dir / CACHE_FILE_NAME).write_text("{not json")
+
+        book = load_book_info(book_service, book_root)
+
+        assert book.metadata.title == "Test"
+        assert load_book_info(book_service, book_root) == book
+        assert book_service.get_book_info.call_count == 1
@@ -7,6 +7,8 @@ import pytest
 from unittest.mock import Mock
 
 from mdbook.domain import (
+    Book,
+    BookMetadata,
     Chapter,
     ChapterMetadata,
     TocEntry,
@@ -19,6 +21,7 @@ from mdbook.domain import (
 from mdbook.services.content_service import ContentService
 from mdbook.services.toc_service import TocService
 from mdbook.services.index_service import IndexService
+from mdbook.services.render_service import RenderService
 
 
 @pytest.fixture
@@ -54,6 +57,12 @@ def index_service(mock_reader_service):
     return IndexService(mock_reader_service)
 
 
+@pytest.fixture
+def render_service(mock_file_repo, mock_reader_service):
+    """Create a RenderService with mock dependencies."""
+    return RenderService(mock_file_repo, mock_reader_service)
+
+
 @pytest.fixture
 def sample_chapter(tmp_path) -> Chapter:
     """Create a sample chapter for testing."""
@@ -122,6 +131,21 @@ Some text.
         assert missing[0].path == "missing.png"
         assert missing[0].exists is False
 
+    def test_repeated_image_checked_once(
+        self, content_service, mock_file_repo, tmp_path
+    ):
+        """Test that an image referenced twice is only looked up once."""
+        content = """![First](shared.png)
+![Second](shared.png)
+"""
+        chapter_path = tmp_path / "chapter.md"
+        mock_file_repo.exists.return_value = False
+
+        missing = content_service.validate_images(content, chapter_path)
+
+        assert [img.line_number for img in missing] == [1, 2]
+        assert mock_file_repo.exists.call_count == 1
+
 
 class TestMermaidExtraction:
     """Tests for mermaid block extraction."""
@@ -333,6 +357,47 @@ class TestBookIndex:
         assert "**Python**" in md
         assert "**algorithms**" in md
 
+    def test_add_location_updates_rendered_locations(self):
+        """Test that a location added after rendering is included."""
+        entry = IndexEntry(term="Python")
+        entry.add_location(IndexTerm("Python", 1, "Intro", anchor="overview"))
+        assert entry.render_locations() == "[Intro](#overview)"
+
+        entry.add_location(IndexTerm("Python", 2, "Basics"))
+
+        assert entry.render_locations() == "[Intro](#overview), Basics"
+
+    def test_entries_kept_sorted(self):
+        """Test that entries are sorted on creation and on add."""
+        index = BookIndex(entries=[IndexEntry(term="python"), IndexEntry(term="Zeta")])
+        index.add(IndexEntry(term="Algorithms"))
+        index.add(IndexEntry(term="rust"))
+
+        assert [e.term for e in index.entries] == [
+            "Algorithms",
+            "python",
+            "rust",
+            "Zeta",
+        ]
+
+    def test_freeze_shares_equal_locations(self):
+        """Test that freeze() makes tuples and shares equal locations."""
+        entry = IndexEntry(
+            term="Python",
+            locations=[
+                IndexTerm("Python", 1, "Intro", anchor="overview"),
+                IndexTerm("Python", 1, "Intro", anchor="overview"),
+            ],
+        )
+        index = BookIndex(entries=[entry])
+
+        index.freeze()
+
+        assert isinstance(entry.locations, tuple)
+        assert entry.locations[0] is entry.locations[1]
+        entry.add_location(IndexTerm("Python", 2, "Basics"))
+        assert len(entry.locations) == 3
+
 
 class TestTocEntry:
     """Tests for TocEntry model."""
@@ -380,3 +445,69 @@ class TestMermaidBlock:
         assert "graph TD" in block.content
         assert block.start_line == 10
         assert block.end_line == 14
+
+
+class TestRenderService:
+    """Tests for RenderService chapter rendering."""
+
+    def test_render_chapter_reuses_cached_html(self, render_service):
+        """Test that rendering identical content twice converts once."""
+        chapter = Mock()
+        content = "# Title\n\nSome *text*."
+
+        first = render_service.render_chapter(chapter, content)
+        render_service._md = Mock()
+        second = render_service.render_chapter(chapter, content)
+
+        assert first == second
+        assert "<em>text</em>" in first
+        render_service._md.convert.assert_not_called()
+
+    def test_render_chapter_full_reads_content_once(
+        self, render_service, mock_reader_service, sample_chapter, tmp_path
+    ):
+        """Test that a full render reads the chapter file a single time."""
+        mock_reader_service.get_chapter_content.return_value = (
+            "---\ntitle: Intro\n---\n# Intro\n\n```mermaid\ngraph TD\n```\n"
+        )
+        book = Book(
+            root_path=tmp_path,
+            metadata=BookMetadata(title="Test Book"),
+            chapters=[sample_chapter],
+        )
+
+        html = render_service.render_chapter_full(sample_chapter, book)
+
+        assert mock_reader_service.get_chapter_content.call_count == 1
+        assert "title: Intro" not in html
+        assert "mermaid.initialize" in html
+
+    def test_render_book_parallel_matches_serial(
+        self, render_service, mock_file_repo, mock_reader_service, tmp_path
+    ):
+        """Test that rendering with worker processes writes identical pages."""
+        chapters = [
+            Chapter(
+                file_path=tmp_path / f"0{n}.md",
+                metadata=ChapterMetadata(title=f"Chapter {n}", number=n),
+            )
+            for n in (1, 2, 3)
+        ]
+        book = Book(
+            root_path=tmp_path,
+            metadata=BookMetadata(title="Test Book"),
+            chapters=chapters,
+        )
+        mock_reader_service.get_chapter_content.side_effect = (
+            lambda ch: f"# {ch.title}\n\n```python\nx = {ch.number}\n```\n"
+        )
+
+        serial = render_service.render_book(book, tmp_path / "serial")
+        serial_html = [c.args[1] for c in mock_file_repo.write_file.call_args_list]
+        mock_file_repo.write_file.reset_mock()
+
+        parallel = render_service.render_book(book, tmp_path / "parallel", jobs=2)
+        parallel_html = [c.args[1] for c in mock_file_repo.write_file.call_args_list]
+
+        assert [p.name for p in parallel] == [p.name for p in serial]
+        assert parallel_html == serial_html
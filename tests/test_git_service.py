@@ -0,0 +1,54 @@
+"""Tests for the git service.
+
+Tests repository discovery that doesn't need to run git.
+"""
+
+import pytest
+
+from mdbook.services import GitService
+
+
+@pytest.fixture
+def git_service(monkeypatch):
+    """Create a GitService with no git discovery overrides."""
+    for name in GitService.GIT_DISCOVERY_ENV:
+        monkeypatch.delenv(name, raising=False)
+    return GitService()
+
+
+class TestRepoDiscovery:
+    """Tests for finding the work tree by walking up to .git."""
+
+    def test_finds_root_from_nested_file(self, git_service, tmp_path):
+        """Test that a chapter deep in the tree resolves to the root."""
+        (tmp_path / ".git").mkdir()
+        chapter = tmp_path / "book" / "src" / "01.md"
+        chapter.parent.mkdir(parents=True)
+        chapter.write_text("# One\n")
+
+        assert git_service.is_git_repo(chapter)
+        assert git_service.get_repo_root(chapter) == tmp_path.resolve()
+
+    def test_git_file_marks_work_tree(self, git_service, tmp_path):
+        """Test that a .git file, as used by worktrees, is recognized."""
+        (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/x\n")
+
+        assert git_service.get_repo_root(tmp_path) == tmp_path.resolve()
+
+    def test_removed_repo_is_forgotten(self, git_service, tmp_path):
+        """Test that a cached root is dropped once its .git is removed."""
+        (tmp_path / ".git").mkdir()
+        chapter = tmp_path / "01.md"
+        chapter.write_text("# One\n")
+        assert git_service._find_work_tree(chapter) == tmp_path.resolve()
+
+        (tmp_path / ".git").rmdir()
+
+        assert git_service._find_work_tree(chapter) != tmp_path.resolve()
+
+    def test_ceiling_directories_defer_to_git(self, git_service, tmp_path, monkeypatch):
+        """Test that GIT_CEILING_DIRECTORIES turns off the .git walk."""
+        (tmp_path / ".git").mkdir()
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+
+        assert git_service._find_work_tree(tmp_path) is None
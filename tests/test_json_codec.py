@@ -0,0 +1,37 @@
+"""Tests for the shared JSON helpers.
+
+Tests that output matches the standard library whether or not orjson
+handles the value.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mdbook.infrastructure import json_dumps, json_loads
+
+
+class TestJsonDumps:
+    """Tests for json_dumps."""
+
+    def test_matches_json_indent(self):
+        """Test that output is the same as json.dumps with indent=2."""
+        obj = {"mcpServers": {"mdbook": {"args": ["run", "mdbook"]}}, "n": 1}
+
+        assert json_dumps(obj) == json.dumps(obj, indent=2)
+
+    def test_wide_integer_falls_back_to_json(self):
+        """Test that integers wider than 64 bits still serialize."""
+        assert json_dumps({"big": 2**70}) == json.dumps({"big": 2**70}, indent=2)
+
+    def test_default_handles_paths(self):
+        """Test that default is used for values JSON can't represent."""
+        assert json_loads(json_dumps({"p": Path("/a/b")}, default=str)) == {
+            "p": "/a/b"
+        }
+
+    def test_unserializable_without_default_raises(self):
+        """Test that values with no default raise TypeError."""
+        with pytest.raises(TypeError):
+            json_dumps({"p": Path("/a/b")})
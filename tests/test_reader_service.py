@@ -0,0 +1,110 @@
+"""Tests for ReaderService content loading.
+
+Tests chapter content reading and caching behavior.
+"""
+
+import os
+
+import pytest
+from unittest.mock import Mock
+
+from mdbook.domain import Chapter, ChapterMetadata
+from mdbook.services.reader_service import ReaderService
+
+
+@pytest.fixture
+def mock_file_repo():
+    """Create a mock file repository that reads from disk."""
+    repo = Mock()
+    repo.exists.return_value = True
+    repo.read_file.side_effect = lambda path: path.read_text(encoding="utf-8")
+    return repo
+
+
+@pytest.fixture
+def reader_service(mock_file_repo):
+    """Create a ReaderService with mock dependencies."""
+    return ReaderService(mock_file_repo, Mock(), Mock())
+
+
+def _chapter(path, number=1) -> Chapter:
+    """Build a chapter pointing at the given file."""
+    return Chapter(
+        file_path=path,
+        metadata=ChapterMetadata(title=f"Chapter {number}", number=number),
+    )
+
+
+class TestChapterContentCache:
+    """Tests for the get_chapter_content cache."""
+
+    def test_unchanged_file_is_read_once(
+        self, reader_service, mock_file_repo, tmp_path
+    ):
+        """Test that repeated reads of an unchanged file hit the cache."""
+        path = tmp_path / "01.md"
+        path.write_text("# One\n")
+        chapter = _chapter(path)
+
+        assert reader_service.get_chapter_content(chapter) == "# One\n"
+        assert reader_service.get_chapter_content(chapter) == "# One\n"
+        assert mock_file_repo.read_file.call_count == 1
+
+    def test_modified_file_is_reread(self, reader_service, mock_file_repo, tmp_path):
+        """Test that a change in mtime or size invalidates the entry."""
+        path = tmp_path / "01.md"
+        path.write_text("# One\n")
+        chapter = _chapter(path)
+        reader_service.get_chapter_content(chapter)
+
+        path.write_text("# One, revised\n")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert reader_service.get_chapter_content(chapter) == "# One, revised\n"
+        assert mock_file_repo.read_file.call_count == 2
+
+    def test_cache_is_bounded(self, reader_service, tmp_path):
+        """Test that the least recently used entry is evicted."""
+        limit = ReaderService.CONTENT_CACHE_SIZE
+        chapters = []
+        for i in range(limit + 1):
+            path = tmp_path / f"{i:02d}.md"
+            path.write_text(f"# {i}\n")
+            chapters.append(_chapter(path, i))
+
+        for chapter in chapters:
+            reader_service.get_chapter_content(chapter)
+
+        assert len(reader_service._content_cache) == limit
+        assert chapters[0].file_path not in reader_service._content_cache
+
+    def test_missing_file_is_not_cached(self, reader_service, mock_file_repo, tmp_path):
+        """Test that files that can't be stat'ed bypass the cache."""
+        mock_file_repo.read_file.side_effect = None
+        mock_file_repo.read_file.return_value = "# Virtual\n"
+        chapter = _chapter(tmp_path / "virtual.md")
+
+        assert reader_service.get_chapter_content(chapter) == "# Virtual\n"
+        assert reader_service._content_cache == {}
+
+    def test_missing_file_raises_without_exists_probe(
+        self, reader_service, mock_file_repo, tmp_path
+    ):
+        """Test that a missing chapter raises FileNotFoundError on read."""
+        chapter = _chapter(tmp_path / "missing.md")
+
+        with pytest.raises(FileNotFoundError, match="Chapter file not found"):
+            reader_service.get_chapter_content(chapter)
+        mock_file_repo.exists.assert_not_called()
+
+
+class TestChapterBody:
+    """Tests for ReaderService.get_chapter_body."""
+
+    def test_strips_frontmatter(self, reader_service, tmp_path):
+        """Test that frontmatter is removed from the chapter body."""
+        path = tmp_path / "01.md"
+        path.write_text("---\ntitle: One\n---\n\n# One\n")
+
+        assert reader_service.get_chapter_body(_chapter(path)) == "# One\n"
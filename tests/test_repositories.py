@@ -0,0 +1,102 @@
+"""Tests for repository implementations.
+
+Tests FileRepository behavior against a real temporary directory.
+"""
+
+import pytest
+
+from mdbook.repositories import FileRepository
+
+
+@pytest.fixture
+def file_repo():
+    """Create a FileRepository instance."""
+    return FileRepository()
+
+
+class TestReadFile:
+    """Tests for FileRepository.read_file."""
+
+    def test_reads_utf8_content(self, file_repo, tmp_path):
+        """Test that file content is decoded as UTF-8."""
+        path = tmp_path / "chapter.md"
+        path.write_bytes("# Caf\u00e9\n".encode("utf-8"))
+
+        assert file_repo.read_file(path) == "# Caf\u00e9\n"
+
+    def test_normalizes_line_endings(self, file_repo, tmp_path):
+        """Test that CRLF and CR line endings are read as LF."""
+        path = tmp_path / "chapter.md"
+        path.write_bytes(b"one\r\ntwo\rthree\n")
+
+        assert file_repo.read_file(path) == "one\ntwo\nthree\n"
+
+    def test_missing_file_raises(self, file_repo, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            file_repo.read_file(tmp_path / "missing.md")
+
+    def test_reads_large_file(self, file_repo, tmp_path):
+        """Test that files above the mmap threshold read the same."""
+        path = tmp_path / "chapter.md"
+        count = FileRepository.MMAP_THRESHOLD // 10
+        path.write_bytes(("Caf\u00e9 au lait\r\n" * count).encode("utf-8"))
+
+        assert file_repo.read_file(path) == "Caf\u00e9 au lait\n" * count
+
+
+class TestListFiles:
+    """Tests for FileRepository.list_files."""
+
+    def test_lists_matching_files_sorted(self, file_repo, tmp_path):
+        """Test that only matching files are returned, in sorted order."""
+        (tmp_path / "b.md").write_text("b")
+        (tmp_path / "a.md").write_text("a")
+        (tmp_path / "notes.txt").write_text("n")
+        (tmp_path / "dir.md").mkdir()
+
+        result = file_repo.list_files(tmp_path, "*.md")
+
+        assert result == [tmp_path / "a.md", tmp_path / "b.md"]
+
+    def test_recursive_pattern(self, file_repo, tmp_path):
+        """Test that recursive patterns descend into subdirectories."""
+        (tmp_path / "top.md").write_text("t")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "nested.md").write_text("n")
+
+        result = file_repo.list_files(tmp_path, "**/*.md")
+
+        assert tmp_path / "sub" / "nested.md" in result
+        assert tmp_path / "top.md" in result
+
+    def test_missing_directory_raises(self, file_repo, tmp_path):
+        """Test that a missing directory raises NotADirectoryError."""
+        with pytest.raises(NotADirectoryError):
+            file_repo.list_files(tmp_path / "missing", "*.md")
+
+    def test_file_instead_of_directory_raises(self, file_repo, tmp_path):
+        """Test that passing a file raises NotADirectoryError."""
+        path = tmp_path / "file.md"
+        path.write_text("x")
+
+        with pytest.raises(NotADirectoryError):
+            file_repo.list_files(path, "*.md")
+
+
+class TestReadHead:
+    """Tests for FileRepository.read_head."""
+
+    def test_reads_only_leading_lines(self, file_repo, tmp_path):
+        """Test that at most max_lines lines are returned."""
+        path = tmp_path / "chapter.md"
+        path.write_text("one\ntwo\nthree\n")
+
+        assert file_repo.read_head(path, 2) == "one\ntwo\n"
+
+    def test_short_file_is_read_whole(self, file_repo, tmp_path):
+        """Test that files shorter than the limit are returned unchanged."""
+        path = tmp_path / "chapter.md"
+        path.write_text("one\ntwo")
+
+        assert file_repo.read_head(path, 10) == "one\ntwo"
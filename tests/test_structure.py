@@ -0,0 +1,242 @@
+"""Tests for structure detection helpers.
+
+Tests content file selection and other StructureService internals.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from mdbook.domain import Book, BookMetadata, Chapter, ChapterMetadata, FormatType
+from mdbook.repositories import FileRepository
+from mdbook.services.structure_service import StructureService
+
+
+@pytest.fixture
+def structure_service():
+    """Create a StructureService with mock repositories."""
+    return StructureService(file_repo=Mock(), config_repo=Mock())
+
+
+@pytest.fixture
+def disk_structure_service():
+    """Create a StructureService backed by the real file system."""
+    return StructureService(file_repo=FileRepository(), config_repo=Mock())
+
+
+class TestPickBestContentFile:
+    """Tests for StructureService._pick_best_content_file."""
+
+    def test_empty_list_returns_none(self, structure_service):
+        """Test that no candidates yields None."""
+        assert structure_service._pick_best_content_file([]) is None
+
+    def test_priority_order(self, structure_service):
+        """Test that suffixes are preferred in priority order."""
+        names = ["draft-final.md", "draft-revised.md", "draft-complete.md"]
+        result = structure_service._pick_best_content_file(names)
+        assert result == "draft-complete.md"
+
+    def test_suffix_match_is_case_insensitive(self, structure_service):
+        """Test that priority suffixes match regardless of case."""
+        names = ["notes.md", "Chapter-ENHANCED.MD"]
+        result = structure_service._pick_best_content_file(names)
+        assert result == "Chapter-ENHANCED.MD"
+
+    def test_falls_back_to_first_file(self, structure_service):
+        """Test that the first file is used when nothing has a priority suffix."""
+        result = structure_service._pick_best_content_file(["b.md", "a.md"])
+        assert result == "b.md"
+
+
+class TestChapterMetadata:
+    """Tests for StructureService._get_chapter_metadata."""
+
+    def test_title_from_heading_near_top(self, disk_structure_service, tmp_path):
+        """Test that the first heading is used as the title."""
+        path = tmp_path / "01-intro.md"
+        path.write_text("# Getting Started\n\n" + "text\n" * 1000)
+
+        metadata = disk_structure_service._get_chapter_metadata(path)
+
+        assert metadata.title == "Getting Started"
+
+    def test_heading_beyond_head_is_found(self, disk_structure_service, tmp_path):
+        """Test that a heading past the head limit still sets the title."""
+        limit = StructureService.METADATA_HEAD_LINES
+        path = tmp_path / "01-intro.md"
+        path.write_text("text\n" * (limit + 5) + "# Late Heading\n")
+
+        metadata = disk_structure_service._get_chapter_metadata(path)
+
+        assert metadata.title == "Late Heading"
+
+    def test_long_frontmatter_is_parsed(self, disk_structure_service, tmp_path):
+        """Test that frontmatter longer than the head limit is parsed."""
+        limit = StructureService.METADATA_HEAD_LINES
+        keys = "".join(f"key{i}: {i}\n" for i in range(limit))
+        path = tmp_path / "01-intro.md"
+        path.write_text(f"---\n{keys}title: Deep Title\n---\n\nBody\n")
+
+        metadata = disk_structure_service._get_chapter_metadata(path)
+
+        assert metadata.title == "Deep Title"
+        assert metadata.extra["key0"] == 0
+
+
+class TestAutoDetect:
+    """Tests for StructureService auto-detection."""
+
+    def test_chapters_numbered_in_reading_order(
+        self, disk_structure_service, tmp_path
+    ):
+        """Test that intro is chapter 0 and files are numbered in order."""
+        (tmp_path / "index.md").write_text("# Welcome\n")
+        for i in range(1, 11):
+            (tmp_path / f"{i:02d}-part.md").write_text(f"# Part {i}\n")
+
+        chapters = disk_structure_service.parse_structure(tmp_path, FormatType.AUTO)
+
+        assert chapters[0].is_intro
+        assert chapters[0].number == 0
+        assert [c.number for c in chapters[1:]] == list(range(1, 11))
+        assert [c.title for c in chapters[1:]] == [f"Part {i}" for i in range(1, 11)]
+
+
+class TestLazyParse:
+    """Tests for deferred chapter metadata."""
+
+    def test_lazy_chapters_read_metadata_on_access(self, tmp_path):
+        """Test that lazy parsing defers file reads until metadata is used."""
+        for i in range(1, 4):
+            (tmp_path / f"{i:02d}-part.md").write_text(f"# Part {i}\n")
+
+        file_repo = FileRepository()
+        service = StructureService(file_repo=file_repo, config_repo=Mock())
+        reads = []
+        original = file_repo.read_head
+
+        def counting_read_head(path, max_lines):
+            reads.append(path)
+            return original(path, max_lines)
+
+        file_repo.read_head = counting_read_head
+
+        chapters = service.parse_structure(tmp_path, FormatType.AUTO, lazy=True)
+
+        assert [c.number for c in chapters] == [1, 2, 3]
+        assert reads == []
+
+        assert chapters[1].title == "Part 2"
+        assert chapters[1].metadata.number == 2
+        assert reads == [tmp_path / "02-part.md"]
+
+
+class TestBookChapterLookup:
+    """Tests for looking up a book's chapters by number."""
+
+    def test_lookup_does_not_load_deferred_metadata(self, tmp_path):
+        """Test that indexing deferred chapters uses their known numbers."""
+        loader = Mock(return_value=ChapterMetadata(title="Two", number=2))
+        chapters = [
+            Chapter.deferred(tmp_path / f"{i:02d}.md", i, loader) for i in (1, 2)
+        ]
+        book = Book(tmp_path, BookMetadata(title="T"), chapters)
+
+        assert book.by_number[2] == (1, chapters[1])
+        assert book.get_chapter(3) is None
+        loader.assert_not_called()
+
+    def test_index_follows_added_chapters(self, tmp_path):
+        """Test that chapters added after a lookup are found."""
+        book = Book(tmp_path, BookMetadata(title="T"))
+        assert book.get_chapter(1) is None
+
+        chapter = Chapter(tmp_path / "01.md", ChapterMetadata(title="One", number=1))
+        book.chapters.append(chapter)
+
+        assert book.get_chapter(1) is chapter
+
+
+class TestChapterDirectories:
+    """Tests for chapter-directory layouts."""
+
+    def test_content_subdirectory_prefers_priority_file(
+        self, disk_structure_service, tmp_path
+    ):
+        """Test that chapter-NN/content picks the highest-priority draft."""
+        for i in (1, 2):
+            content_dir = tmp_path / f"chapter-{i:02d}" / "content"
+            content_dir.mkdir(parents=True)
+            (content_dir / "draft.md").write_text(f"# Draft {i}\n")
+            (content_dir / "draft-complete.md").write_text(f"# Complete {i}\n")
+        direct_dir = tmp_path / "chapter-03"
+        direct_dir.mkdir()
+        (direct_dir / "_notes.md").write_text("# Notes\n")
+        (direct_dir / "text.md").write_text("# Direct 3\n")
+
+        chapters = disk_structure_service.parse_structure(tmp_path, FormatType.AUTO)
+
+        assert [c.title for c in chapters] == ["Complete 1", "Complete 2", "Direct 3"]
+        assert chapters[0].file_path == (
+            tmp_path / "chapter-01" / "content" / "draft-complete.md"
+        )
+
+
+class TestExtractHeadingTitle:
+    """Tests for StructureService._extract_heading_title."""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            ("# Title\n\nBody", "Title"),
+            ("Intro\n  # Indented Title  \n", "Indented Title"),
+            ("#  \n# Real Title\n", "Real Title"),
+            ("## Subheading\n#NoSpace\n", None),
+            ("---\ntitle: X\n---\n# After Frontmatter\n", "After Frontmatter"),
+        ],
+    )
+    def test_first_h1_heading(self, structure_service, content, expected):
+        """Test that the first level-1 heading is returned."""
+        assert structure_service._extract_heading_title(content) == expected
+
+
+class TestMetadataCache:
+    """Tests for the per-file chapter metadata cache."""
+
+    def test_malformed_frontmatter_parsed_once(self, tmp_path):
+        """Test that a parse failure is remembered until the file changes."""
+        path = tmp_path / "01-broken.md"
+        path.write_text("---\ntitle: [unclosed\n---\n# Heading\n")
+
+        file_repo = Mock(wraps=FileRepository())
+        service = StructureService(file_repo=file_repo, config_repo=Mock())
+
+        first = service._get_chapter_metadata(path)
+        second = service._get_chapter_metadata(path)
+
+        assert first.title == second.title == "Broken"
+        assert file_repo.read_head.call_count == 1
+
+    def test_changed_file_is_reparsed(self, disk_structure_service, tmp_path):
+        """Test that edits to a chapter invalidate its cached metadata."""
+        path = tmp_path / "01-part.md"
+        path.write_text("# Old Title\n")
+        assert disk_structure_service._get_chapter_metadata(path).title == "Old Title"
+
+        path.write_text("# A New Title\n")
+
+        assert disk_structure_service._get_chapter_metadata(path).title == "A New Title"
+
+    def test_read_error_is_not_cached(self, tmp_path):
+        """Test that a failed read is retried rather than remembered."""
+        path = tmp_path / "01-locked.md"
+        path.write_text("# Locked\n")
+
+        file_repo = Mock(wraps=FileRepository())
+        file_repo.read_head.side_effect = PermissionError("denied")
+        service = StructureService(file_repo=file_repo, config_repo=Mock())
+        assert service._parse_chapter_file(path) is None
+
+        file_repo.read_head.side_effect = None
+
+        assert service._parse_chapter_file(path).title == "Locked"